@@ -6,7 +6,8 @@ Inputs:
   - Course CSV with columns: prefix, number, title, description (plus any others)
 
 Outputs:
-  - Full course list with is_ai_related and is_ethics_related boolean
+  - Full course list with is_ai_related and is_ethics_related boolean (opt-in via
+    --emit-full; parquet by default, CSV with --csv-compat)
   - AI-only subset CSV (deduped by prefix + number)
   - Prefix totals CSV (unique courses per prefix)
   - Summary CSV (total unique courses)
@@ -24,6 +25,7 @@ import sys
 from pathlib import Path
 
 try:
+    import numpy as np
     import pandas as pd
 except ImportError:  # pragma: no cover - runtime dependency check
     print(
@@ -32,16 +34,32 @@ except ImportError:  # pragma: no cover - runtime dependency check
     raise SystemExit(1)
 
 try:
-    from thefuzz import fuzz
+    import pyarrow as pa
 except ImportError:  # pragma: no cover - runtime dependency check
     print(
-        "Missing dependency: thefuzz. Install with: pip install thefuzz[speedup]",
+        "Missing dependency: pyarrow. Install with: pip install pyarrow",
         file=sys.stderr,
     )
     raise SystemExit(1)
 
-# Local import after dependency checks so missing third-party libs fail with a clear message.
+try:
+    import rapidfuzz  # noqa: F401 - used through scoring.fuzzy_score_matrix
+except ImportError:  # pragma: no cover - runtime dependency check
+    print(
+        "Missing dependency: rapidfuzz. Install with: pip install rapidfuzz",
+        file=sys.stderr,
+    )
+    raise SystemExit(1)
+
+# Local imports after dependency checks so missing third-party libs fail with a clear message.
 from ethics_analysis import EthicsMatcher
+from scoring import (
+    FUZZY_BACKENDS,
+    factorize_normalized_text,
+    fuzzy_score_matrix,
+    map_text_shards,
+    write_csv,
+)
 
 # Primary patterns: explicit AI terms (high precision).
 PRIMARY_PATTERNS = [
@@ -49,11 +67,11 @@ PRIMARY_PATTERNS = [
     r"\bmachine learning\b",
     r"\bdeep learning\b",
     r"\bgenerative ai\b",
-    r"\blarge language model(s)?\b",
+    r"\blarge language models?\b",
     r"\bllm\b",
     r"\bgpt\b",
     r"\bchatgpt\b",
-    r"\bneural network(s)?\b",
+    r"\bneural networks?\b",
     r"\breinforcement learning\b",
     r"\bnatural language processing\b",
     r"\bnlp\b",
@@ -61,14 +79,14 @@ PRIMARY_PATTERNS = [
     r"\bintelligent systems?\b",
     r"\bai\b",
     r"\bagentic\b",
-    r"\bmulti[- ]agent(s)?\b",
+    r"\bmulti[- ]agents?\b",
     r"\bintelligent agents?\b",
 ]
 
 # Secondary patterns: ambiguous terms that require AI context to count.
 SECONDARY_PATTERNS = [
-    r"\bethic(s|al)?\b",
-    r"\bagent(s)?\b",
+    r"\bethic(?:s|al)?\b",
+    r"\bagents?\b",
     r"\bautonomous systems?\b",
 ]
 
@@ -79,11 +97,11 @@ CONTEXT_PATTERNS = [
     r"\bmachine learning\b",
     r"\bdeep learning\b",
     r"\bgenerative ai\b",
-    r"\blarge language model(s)?\b",
+    r"\blarge language models?\b",
     r"\bllm\b",
     r"\bgpt\b",
     r"\bchatgpt\b",
-    r"\bneural network(s)?\b",
+    r"\bneural networks?\b",
     r"\bnatural language processing\b",
     r"\bnlp\b",
     r"\bcomputer vision\b",
@@ -91,6 +109,7 @@ CONTEXT_PATTERNS = [
 ]
 
 # Fuzzy phrases: explicit AI phrases for typo/variation tolerance.
+# Stored already normalized (see scoring.normalize_text) so they are scored as-is.
 FUZZY_PHRASES = [
     "artificial intelligence",
     "machine learning",
@@ -107,35 +126,62 @@ FUZZY_PHRASES = [
     "agentic",
 ]
 
-NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
 
+def compile_alternation(patterns: list[str]) -> re.Pattern[str]:
+    """Fuse patterns into a single alternation so each text is scanned once."""
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns))
 
-def normalize_text(text: str) -> str:
-    """Lowercase and normalize whitespace/punctuation for reliable matching."""
-    lowered = text.lower()
-    # Common catalog punctuation variant: "A.I." -> "ai" so word-boundary matches still work.
-    lowered = re.sub(r"\ba\.\s*i\.?\b", "ai", lowered)
-    cleaned = NON_ALNUM_RE.sub(" ", lowered)
-    return " ".join(cleaned.split())
 
+PRIMARY_RE = compile_alternation(PRIMARY_PATTERNS)
+SECONDARY_RE = compile_alternation(SECONDARY_PATTERNS)
+CONTEXT_RE = compile_alternation(CONTEXT_PATTERNS)
 
-def compile_patterns(patterns: list[str]) -> list[re.Pattern[str]]:
-    """Compile regex patterns once for efficient reuse."""
-    return [re.compile(pattern) for pattern in patterns]
 
+def keyword_match_mask(texts_norm: pd.Series) -> np.ndarray:
+    """Return the regex keyword match per normalized text as a bool array."""
+    # Primary match: explicit AI terms.
+    primary_match = texts_norm.str.contains(PRIMARY_RE.pattern, na=False)
+    # Secondary match: ambiguous terms, only counted with AI context.
+    secondary_match = texts_norm.str.contains(SECONDARY_RE.pattern, na=False)
+    context_match = texts_norm.str.contains(CONTEXT_RE.pattern, na=False)
+    return (primary_match | (secondary_match & context_match)).to_numpy(dtype=bool)
+
+
+def max_fuzzy_scores(
+    texts_norm: list[str],
+    keyword_norms: list[str],
+    min_score: int = 0,
+    backend: str = "rapidfuzz",
+    cache_dir: Path | None = None,
+) -> np.ndarray:
+    """Return the max fuzzy match score per text against a list of normalized phrases.
+
+    Rows whose every phrase was skipped by the min_score prefilter score 0.
+    """
+    scores = fuzzy_score_matrix(
+        texts_norm, keyword_norms, min_score, backend, cache_dir
+    )
+    if not scores.shape[1]:
+        return np.zeros(len(texts_norm), dtype=np.uint8)
+    return scores.max(axis=1)
 
-def matches_any(text_norm: str, patterns: list[re.Pattern[str]]) -> bool:
-    """Return True if any compiled pattern matches the normalized text."""
-    if not text_norm:
-        return False
-    return any(pattern.search(text_norm) for pattern in patterns)
 
+def ambiguous_length_mask(
+    texts_norm: list[str], keyword_norms: list[str]
+) -> np.ndarray:
+    """Return True for texts whose length is within -20%/+25% of some phrase length.
 
-def max_fuzzy_score(text_norm: str, keyword_norms: list[str]) -> int:
-    """Return the max fuzzy match score against a list of normalized phrases."""
-    if not text_norm:
-        return 0
-    return max(fuzz.partial_ratio(text_norm, keyword) for keyword in keyword_norms)
+    These are short, phrase-sized texts (e.g. a bare title) where a typo is the most
+    plausible reason an explicit AI phrase failed the exact regex pass.
+    """
+    text_lens = np.fromiter(
+        (len(text) for text in texts_norm), dtype=np.int64, count=len(texts_norm)
+    )
+    phrase_lens = np.array([len(phrase) for phrase in keyword_norms], dtype=np.int64)
+    in_band = (text_lens[:, None] >= 0.8 * phrase_lens[None, :]) & (
+        text_lens[:, None] <= 1.25 * phrase_lens[None, :]
+    )
+    return in_band.any(axis=1)
 
 
 def main() -> None:
@@ -183,6 +229,39 @@ def main() -> None:
         action="store_true",
         help="Disable fuzzy matching (default: enabled).",
     )
+    parser.add_argument(
+        "--fuzzy-only-on-ambiguous",
+        action="store_true",
+        help=(
+            "Only fuzzy-match texts whose length is close to a fuzzy phrase "
+            "(default: fuzzy-match every text the regex pass missed)."
+        ),
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write cached fuzzy scores (default: <output-dir>/_cache).",
+    )
+    parser.add_argument(
+        "--fuzzy-backend",
+        choices=FUZZY_BACKENDS,
+        default="rapidfuzz",
+        help="Fuzzy scoring backend; numba requires numba (default: rapidfuzz).",
+    )
+    parser.add_argument(
+        "--emit-full",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help=(
+            "Also write the full term-level course list with flags, as parquet "
+            "unless --csv-compat is set (default: skipped)."
+        ),
+    )
+    parser.add_argument(
+        "--csv-compat",
+        action="store_true",
+        help="Write the --emit-full output as CSV instead of parquet.",
+    )
     args = parser.parse_args()
 
     input_courses = Path(args.input_courses)
@@ -192,9 +271,10 @@ def main() -> None:
 
     output_dir = Path(args.output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
+    cache_dir = None if args.no_cache else output_dir / "_cache"
 
     # Load and validate course data.
-    df = pd.read_csv(input_courses)
+    df = pd.read_csv(input_courses, dtype_backend="pyarrow")
     required_cols = [
         args.prefix_col,
         args.number_col,
@@ -207,65 +287,54 @@ def main() -> None:
         raise SystemExit(1)
 
     # Build normalized text for consistent matching across title/description.
-    primary_patterns = compile_patterns(PRIMARY_PATTERNS)
-    secondary_patterns = compile_patterns(SECONDARY_PATTERNS)
-    context_patterns = compile_patterns(CONTEXT_PATTERNS)
     ethics_matcher = EthicsMatcher.build()
-    fuzzy_phrases = [normalize_text(keyword) for keyword in FUZZY_PHRASES]
-    title_series = df[args.title_col].fillna("").astype(str)
-    description_series = df[args.description_col].fillna("").astype(str)
-    text_series = title_series + " " + description_series
-    text_norm_series = text_series.map(normalize_text)
-
-    # Primary match: explicit AI terms.
-    primary_match = text_norm_series.map(
-        lambda text: matches_any(text, primary_patterns)
-    )
-    # Secondary match: ambiguous terms, only counted with AI context.
-    secondary_match = text_norm_series.map(
-        lambda text: matches_any(text, secondary_patterns)
+    # The same course text repeats across terms, so score each distinct text once and
+    # scatter the results back to rows through text_codes.
+    text_codes, unique_norm_series = factorize_normalized_text(
+        df[args.title_col], df[args.description_col]
     )
-    context_match = text_norm_series.map(
-        lambda text: matches_any(text, context_patterns)
-    )
-    keyword_match = primary_match | (secondary_match & context_match)
+
+    keyword_match = map_text_shards(keyword_match_mask, unique_norm_series)
 
     # Optional fuzzy match for minor typos or small variations.
-    if args.disable_fuzzy:
-        fuzzy_match = False
-    else:
-        fuzzy_scores = text_norm_series.map(
-            lambda text: max_fuzzy_score(text, fuzzy_phrases)
+    fuzzy_match = np.zeros(len(unique_norm_series), dtype=bool)
+    if not args.disable_fuzzy:
+        # Results are OR-ed, so only texts the regex pass missed need fuzzy scoring.
+        texts = unique_norm_series.to_numpy()
+        candidates_idx = np.flatnonzero(~keyword_match)
+        if args.fuzzy_only_on_ambiguous:
+            # Texts outside the phrase length band are skipped and score 0.
+            in_band = ambiguous_length_mask(
+                texts[candidates_idx].tolist(), FUZZY_PHRASES
+            )
+            candidates_idx = candidates_idx[in_band]
+        fuzzy_scores = max_fuzzy_scores(
+            texts[candidates_idx].tolist(),
+            FUZZY_PHRASES,
+            args.fuzzy_threshold,
+            args.fuzzy_backend,
+            cache_dir,
         )
-        fuzzy_match = fuzzy_scores >= args.fuzzy_threshold
+        fuzzy_match[candidates_idx] = fuzzy_scores >= args.fuzzy_threshold
 
-    ethics_match = [
-        ethics_matcher.is_match(title, description)
-        for title, description in zip(title_series, description_series)
-    ]
+    ethics_match = ethics_matcher.is_match_series(
+        df[args.title_col], df[args.description_col]
+    )
 
-    df["is_ai_related"] = keyword_match | fuzzy_match
+    df["is_ai_related"] = (keyword_match | fuzzy_match)[text_codes]
     df["is_ethics_related"] = ethics_match
 
     # Deduplicate by prefix + number and preserve a single AI + ethics flag per course.
     # A course may appear in multiple terms; for curriculum coverage we treat it as one unique course.
-    unique_flags = (
-        df.groupby([args.prefix_col, args.number_col], dropna=False)[
-            ["is_ai_related", "is_ethics_related"]
-        ]
-        .any()
-        .reset_index()
-    )
-    unique_courses = (
-        df.sort_values([args.prefix_col, args.number_col])
-        .drop_duplicates(subset=[args.prefix_col, args.number_col])
-        .drop(columns=["is_ai_related", "is_ethics_related"])
-        .merge(unique_flags, on=[args.prefix_col, args.number_col], how="left")
-    )
-    unique_courses["is_ai_related"] = unique_courses["is_ai_related"].fillna(False)
-    unique_courses["is_ethics_related"] = unique_courses["is_ethics_related"].fillna(
-        False
+    key_cols = [args.prefix_col, args.number_col]
+    flag_cols = ["is_ai_related", "is_ethics_related"]
+    df_sorted = df.sort_values(key_cols, kind="stable")
+    df_sorted[flag_cols] = (
+        df_sorted.groupby(key_cols, sort=False, dropna=False)[flag_cols]
+        .transform("any")
+        .astype(bool)
     )
+    unique_courses = df_sorted.drop_duplicates(subset=key_cols)
 
     # Total unique courses per prefix.
     prefix_totals = (
@@ -281,22 +350,32 @@ def main() -> None:
     ai_subset = unique_courses[unique_courses["is_ai_related"]].sort_values(
         [args.prefix_col, args.number_col]
     )
-    full_output = output_dir / "nau_courses_with_flag.csv"
+    full_output = output_dir / (
+        "nau_courses_with_flag.csv" if args.csv_compat else "nau_courses_with_flag.parquet"
+    )
     unique_output = output_dir / "nau_unique_courses_with_flag.csv"
     ai_output = output_dir / "nau_courses_ai_subset.csv"
     prefix_totals_output = output_dir / "nau_prefix_totals.csv"
     summary_output = output_dir / "nau_summary.csv"
 
-    df.to_csv(full_output, index=False)
-    unique_courses.to_csv(unique_output, index=False)
-    ai_subset.to_csv(ai_output, index=False)
-    prefix_totals.to_csv(prefix_totals_output, index=False)
-    pd.DataFrame(
-        [{"metric": "total_unique_courses", "value": int(len(unique_courses))}]
-    ).to_csv(summary_output, index=False)
+    if args.emit_full:
+        if args.csv_compat:
+            write_csv(df, full_output)
+        else:
+            df.to_parquet(full_output, index=False, compression="zstd")
+    write_csv(unique_courses, unique_output)
+    write_csv(ai_subset, ai_output)
+    write_csv(prefix_totals, prefix_totals_output)
+    write_csv(
+        pa.table(
+            {"metric": ["total_unique_courses"], "value": [int(len(unique_courses))]}
+        ),
+        summary_output,
+    )
 
     print("Analysis complete.")
-    print(f"Full course list with AI flag: {full_output}")
+    if args.emit_full:
+        print(f"Full course list with AI flag: {full_output}")
     print(f"Unique course list with flags: {unique_output}")
     print(f"AI-only subset: {ai_output}")
     print(f"Prefix totals: {prefix_totals_output}")
@@ -13,6 +13,7 @@ import sys
 from pathlib import Path
 
 try:
+    import numpy as np
     import pandas as pd
 except ImportError:  # pragma: no cover - runtime dependency check
     print(
@@ -21,14 +22,41 @@ except ImportError:  # pragma: no cover - runtime dependency check
     raise SystemExit(1)
 
 try:
-    from thefuzz import fuzz  # type: ignore
+    import pyarrow  # noqa: F401 - backs the Arrow string columns read below
 except ImportError:  # pragma: no cover - runtime dependency check
     print(
-        "Missing dependency: thefuzz. Install with: pip install thefuzz[speedup]",
+        "Missing dependency: pyarrow. Install with: pip install pyarrow",
         file=sys.stderr,
     )
     raise SystemExit(1)
 
+try:
+    import rapidfuzz  # noqa: F401 - used through scoring.fuzzy_score_matrix
+except ImportError:  # pragma: no cover - runtime dependency check
+    print(
+        "Missing dependency: rapidfuzz. Install with: pip install rapidfuzz",
+        file=sys.stderr,
+    )
+    raise SystemExit(1)
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - runtime dependency check
+    print(
+        "Missing dependency: pyahocorasick. Install with: pip install pyahocorasick",
+        file=sys.stderr,
+    )
+    raise SystemExit(1)
+
+# Local import after dependency checks so missing third-party libs fail with a clear message.
+from scoring import (
+    FUZZY_BACKENDS,
+    factorize_normalized_text,
+    fuzzy_score_matrix,
+    map_text_shards,
+    write_csv,
+)
+
 # Broad patterns are grouped by label so the output can explain *why* a course matched.
 BROAD_PATTERNS: list[tuple[str, str]] = [
     ("artificial_intelligence", r"\bartificial intelligence\b"),
@@ -36,11 +64,11 @@ BROAD_PATTERNS: list[tuple[str, str]] = [
     ("machine_learning", r"\bmachine learning\b"),
     ("deep_learning", r"\bdeep learning\b"),
     ("generative_ai", r"\bgenerative ai\b"),
-    ("llm", r"\blarge language model(s)?\b"),
+    ("llm", r"\blarge language models?\b"),
     ("llm", r"\bllm\b"),
     ("gpt", r"\bgpt\b"),
     ("chatgpt", r"\bchatgpt\b"),
-    ("neural_network", r"\bneural network(s)?\b"),
+    ("neural_network", r"\bneural networks?\b"),
     ("reinforcement_learning", r"\breinforcement learning\b"),
     ("nlp", r"\bnatural language processing\b"),
     ("nlp", r"\bnlp\b"),
@@ -66,6 +94,7 @@ BROAD_PATTERNS: list[tuple[str, str]] = [
     ("data_science", r"\bdata science\b"),
 ]
 
+# Stored already normalized (see scoring.normalize_text) so they are scored as-is.
 BROAD_FUZZY_PHRASES = [
     "artificial intelligence",
     "machine learning",
@@ -93,27 +122,73 @@ BROAD_FUZZY_PHRASES = [
     "data science",
 ]
 
-NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+# One alternation over every broad pattern (RE2-compatible for Arrow string kernels).
+BROAD_RE = re.compile("|".join(f"(?:{pattern})" for _, pattern in BROAD_PATTERNS))
+
+
+def literal_variants(pattern: str) -> list[str]:
+    """Expand a word-bounded broad pattern into the literal phrases it matches.
+
+    Broad patterns are plain phrases wrapped in \\b, optionally with a trailing "s?".
+    """
+    phrase = pattern.removeprefix(r"\b").removesuffix(r"\b")
+    optional_plural = phrase.endswith("s?")
+    phrase = phrase.removesuffix("s?")
+    if not re.fullmatch(r"[a-z0-9 ]+", phrase):
+        raise ValueError(f"Broad pattern is not a literal phrase: {pattern!r}")
+    return [phrase, f"{phrase}s"] if optional_plural else [phrase]
+
 
+def build_broad_automaton() -> ahocorasick.Automaton:
+    """Build one Aho-Corasick automaton over every broad phrase.
 
-def normalize_text(text: str) -> str:
-    lowered = text.lower()
-    # Common catalog punctuation variant: "A.I." -> "ai" so word-boundary matches still work.
-    lowered = re.sub(r"\ba\.\s*i\.?\b", "ai", lowered)
-    cleaned = NON_ALNUM_RE.sub(" ", lowered)
-    return " ".join(cleaned.split())
+    Phrases are stored space-padded; normalized text only contains [a-z0-9 ] with
+    single spaces, so matching against the space-padded text enforces the same word
+    boundaries as the regex patterns. Each phrase maps to the labels that share it.
+    """
+    labels_by_phrase: dict[str, list[str]] = {}
+    for label, pattern in BROAD_PATTERNS:
+        for phrase in literal_variants(pattern):
+            labels_by_phrase.setdefault(f" {phrase} ", []).append(label)
+    automaton = ahocorasick.Automaton()
+    for phrase, labels in labels_by_phrase.items():
+        automaton.add_word(phrase, tuple(labels))
+    automaton.make_automaton()
+    return automaton
 
-def best_fuzzy_match(text_norm: str, phrases: list[str]) -> tuple[int, str]:
-    if not text_norm:
-        return 0, ""
-    best_score = -1
-    best_phrase = ""
-    for phrase in phrases:
-        score = fuzz.partial_ratio(text_norm, phrase)
-        if score > best_score:
-            best_score = score
-            best_phrase = phrase
-    return best_score, best_phrase
+
+BROAD_AUTOMATON = build_broad_automaton()
+
+
+def broad_match_mask(texts_norm: pd.Series) -> np.ndarray:
+    """Return whether any broad pattern occurs, per normalized text."""
+    return texts_norm.str.contains(BROAD_RE.pattern, na=False).to_numpy(dtype=bool)
+
+
+def broad_labels(text_norm: str) -> list[str]:
+    """Return the sorted, de-duplicated labels of every broad pattern in the text."""
+    hits: set[str] = set()
+    for _, labels in BROAD_AUTOMATON.iter(f" {text_norm} "):
+        hits.update(labels)
+    return sorted(hits)
+
+
+def best_fuzzy_matches(
+    texts_norm: list[str],
+    phrases: list[str],
+    min_score: int = 0,
+    backend: str = "rapidfuzz",
+    cache_dir: Path | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return (best score, best phrase index) per text from one batched score matrix.
+
+    Pairs skipped by the min_score prefilter score 0, which cannot change the best
+    phrase of any text that actually reaches min_score.
+    """
+    scores = fuzzy_score_matrix(texts_norm, phrases, min_score, backend, cache_dir)
+    # argmax keeps the first phrase on ties, matching the old strict ">" scan.
+    best_idx = scores.argmax(axis=1)
+    return scores[np.arange(len(texts_norm)), best_idx], best_idx
 
 
 def main() -> None:
@@ -141,6 +216,17 @@ def main() -> None:
         action="store_true",
         help="Disable fuzzy matching (default: enabled).",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write cached fuzzy scores (default: <output dir>/_cache).",
+    )
+    parser.add_argument(
+        "--fuzzy-backend",
+        choices=FUZZY_BACKENDS,
+        default="rapidfuzz",
+        help="Fuzzy scoring backend; numba requires numba (default: rapidfuzz).",
+    )
     args = parser.parse_args()
 
     input_courses = Path(args.input_courses)
@@ -150,56 +236,53 @@ def main() -> None:
 
     output_path = Path(args.output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_dir = None if args.no_cache else output_path.parent / "_cache"
 
-    df = pd.read_csv(input_courses)
+    df = pd.read_csv(input_courses, dtype_backend="pyarrow")
     required_cols = ["prefix", "number", "title", "description"]
     missing = [col for col in required_cols if col not in df.columns]
     if missing:
         print(f"Missing required columns: {missing}", file=sys.stderr)
         raise SystemExit(1)
 
-    compiled = [(label, re.compile(pattern)) for label, pattern in BROAD_PATTERNS]
-    fuzzy_phrases = [normalize_text(term) for term in BROAD_FUZZY_PHRASES]
-
-    titles = df["title"].fillna("").astype(str)
-    descriptions = df["description"].fillna("").astype(str)
-    text_series = titles + " " + descriptions
-    text_norm_series = text_series.map(normalize_text)
-
-    reasons: list[str] = []
-    matched: list[bool] = []
-    fuzzy_phrases_matched: list[str] = []
-
-    for text_norm in text_norm_series:
-        hits = [label for label, rx in compiled if rx.search(text_norm)]
-        reason = ",".join(sorted(set(hits))) if hits else ""
-        reasons.append(reason)
-        matched.append(bool(hits))
-
-    if args.disable_fuzzy:
-        fuzzy_match = [False] * len(df)
-        fuzzy_phrases_matched = [""] * len(df)
-    else:
-        fuzzy_match: list[bool] = []
-        for text in text_norm_series:
-            score, phrase = best_fuzzy_match(text, fuzzy_phrases)
-            is_match = score >= args.fuzzy_threshold
-            fuzzy_match.append(is_match)
-            fuzzy_phrases_matched.append(phrase if is_match else "")
-
-    df["is_ai_candidate"] = [m or f for m, f in zip(matched, fuzzy_match)]
-
-    final_reasons: list[str] = []
-    for reason, is_fuzzy, phrase in zip(reasons, fuzzy_match, fuzzy_phrases_matched):
-        if reason:
-            final_reasons.append(reason)
-        elif is_fuzzy and phrase:
-            final_reasons.append(f"fuzzy:{phrase}")
-        else:
-            final_reasons.append("")
-
-    df["ai_candidate_reason"] = final_reasons
-    df["ai_candidate_fuzzy_phrase"] = fuzzy_phrases_matched
+    # The same course text repeats across terms, so score each distinct text once and
+    # scatter the results back to rows through text_codes.
+    text_codes, unique_norm_series = factorize_normalized_text(
+        df["title"], df["description"]
+    )
+
+    # Vectorized pass finds candidate texts; per-label reasons are only built for those.
+    matched = map_text_shards(broad_match_mask, unique_norm_series)
+    n_texts = len(unique_norm_series)
+    reasons = np.full(n_texts, "", dtype=object)
+    reasons[matched] = unique_norm_series[matched].map(
+        lambda text: ",".join(broad_labels(text))
+    ).to_numpy(dtype=object)
+
+    fuzzy_match = np.zeros(n_texts, dtype=bool)
+    fuzzy_phrases_matched = np.full(n_texts, "", dtype=object)
+    if not args.disable_fuzzy:
+        best_scores, best_idx = best_fuzzy_matches(
+            unique_norm_series.to_list(),
+            BROAD_FUZZY_PHRASES,
+            args.fuzzy_threshold,
+            args.fuzzy_backend,
+            cache_dir,
+        )
+        fuzzy_match = best_scores >= args.fuzzy_threshold
+        best_phrases = np.asarray(BROAD_FUZZY_PHRASES, dtype=object)[best_idx]
+        fuzzy_phrases_matched = np.where(fuzzy_match, best_phrases, "")
+
+    # Regex labels win; otherwise fall back to the fuzzy phrase, if any.
+    final_reasons = np.where(
+        reasons != "",
+        reasons,
+        np.where(fuzzy_match, "fuzzy:" + fuzzy_phrases_matched, ""),
+    )
+
+    df["is_ai_candidate"] = (matched | fuzzy_match)[text_codes]
+    df["ai_candidate_reason"] = final_reasons[text_codes]
+    df["ai_candidate_fuzzy_phrase"] = fuzzy_phrases_matched[text_codes]
 
     subset = (
         df[df["is_ai_candidate"]]
@@ -207,7 +290,7 @@ def main() -> None:
         .sort_values(["prefix", "number"])
     )
 
-    subset.to_csv(output_path, index=False)
+    write_csv(subset, output_path)
 
     print(f"Wrote {len(subset)} AI candidates to {output_path}")
 
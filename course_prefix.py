@@ -1,9 +1,11 @@
 """
 Extracts course prefixes from the NAU Course Numbering and Prefixes PDF.
 
-This script uses the `pdfplumber` library to read a PDF file containing a table
-of course prefixes and their corresponding subjects. It then uses regular
-expressions to find and extract these prefixes.
+This script uses the `pypdf` library to read the text of a PDF file containing a
+table of course prefixes and their corresponding subjects. It then uses regular
+expressions to find and extract these prefixes. Only the text stream is needed
+(no table coordinates), so pypdf's plain text extraction is used instead of a
+layout-aware parser.
 
 The main purpose of this script is to generate the `PREFIXES` list used in the
 main `scrape.py` scraping script. When run as a standalone script, it prints
@@ -14,7 +16,7 @@ import re
 from pathlib import Path
 from typing import List
 
-import pdfplumber
+from pypdf import PdfReader
 
 # Path to the PDF file containing the course prefixes.
 # This may need to be updated if the file name or location changes.
@@ -32,34 +34,23 @@ def extract_prefixes(pdf_path: str) -> List[str]:
     Returns:
         List[str]: A sorted list of unique course prefixes.
     """
-    prefixes = set()
-
     # Regex to match a line that starts with a course prefix (e.g., "ACC Accounting").
-    # A prefix is defined as 2-6 uppercase letters, possibly with an ampersand.
-    prefix_pattern = re.compile(r"^([A-Z&]{2,6})\s+([A-Za-z].+)$")
-
-    with pdfplumber.open(pdf_path) as pdf:
-        for page in pdf.pages:
-            text = page.extract_text() or ""
-            for line in text.splitlines():
-                line = line.strip()
-                match = prefix_pattern.match(line)
-                if not match:
-                    continue
-
-                code = match.group(1)
-                subject = match.group(2).strip()
-
-                # Filter out common table headers or noise that might match the pattern.
-                if code in {"Course", "Code", "Subject", "Letter"}:
-                    continue
-                # Ensure the code is primarily alphabetic, allowing for '&'.
-                if not code.isalpha() and "&" not in code:
-                    continue
+    # A prefix is defined as 2-6 uppercase letters, possibly with an ampersand, and
+    # the subject must have at least two characters after trimming the line.
+    # [^\S\n] is whitespace other than a newline, so a match never spans two lines.
+    prefix_pattern = re.compile(
+        r"^[^\S\n]*([A-Z&]{2,6})[^\S\n]+[A-Za-z][^\n]*\S", re.MULTILINE
+    )
 
-                prefixes.add(code)
+    # Scan all pages in one pass instead of matching each line in Python.
+    reader = PdfReader(pdf_path)
+    full_text = "\n".join(page.extract_text() or "" for page in reader.pages)
+    codes = set(prefix_pattern.findall(full_text))
 
-    return sorted(list(prefixes))
+    # Filter out common table headers or noise that might match the pattern.
+    codes -= {"Course", "Code", "Subject", "Letter"}
+    # Ensure the code is primarily alphabetic, allowing for '&'.
+    return sorted(code for code in codes if code.isalpha() or "&" in code)
 
 
 if __name__ == "__main__":
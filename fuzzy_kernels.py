@@ -0,0 +1,115 @@
+"""
+Numba-compiled partial_ratio kernel for batch fuzzy scoring.
+
+Optional accelerator behind `ai_analysis.py --fuzzy-backend numba`. Texts and phrases
+are packed into flat uint8 buffers plus offset arrays so the kernel never touches
+Python objects, and rows are scored in parallel with `prange`.
+
+Scores follow RapidFuzz's partial_ratio: the shorter string is slid across the longer
+one (including the partial windows at both ends) and each window gets the Indel ratio
+100 * (1 - (len_a + len_b - 2 * LCS) / (len_a + len_b)), rounded half up to an int.
+LCS uses the bit-parallel (Hyyrö) algorithm, so the shorter string of every pair must
+be at most 64 characters. Inputs are expected to be normalized (ASCII a-z, 0-9, space).
+"""
+from __future__ import annotations
+
+import numpy as np
+from numba import njit, prange
+
+MAX_NEEDLE_LEN = 64
+
+_ONE = np.uint64(1)
+_ALL_ONES = np.uint64(0xFFFFFFFFFFFFFFFF)
+_M1 = np.uint64(0x5555555555555555)
+_M2 = np.uint64(0x3333333333333333)
+_M4 = np.uint64(0x0F0F0F0F0F0F0F0F)
+_H01 = np.uint64(0x0101010101010101)
+
+
+def pack_strings(strings: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    """Pack strings into a flat uint8 buffer and an int64 offsets array (len + 1)."""
+    encoded = [text.encode("ascii") for text in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(chunk) for chunk in encoded], out=offsets[1:])
+    buf = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    return buf, offsets
+
+
+@njit(cache=True)
+def _popcount64(x):
+    x = x - ((x >> np.uint64(1)) & _M1)
+    x = (x & _M2) + ((x >> np.uint64(2)) & _M2)
+    x = (x + (x >> np.uint64(4))) & _M4
+    return (x * _H01) >> np.uint64(56)
+
+
+@njit(cache=True)
+def _lcs(pm, mask, haystack, start, stop):
+    """Bit-parallel LCS length of the needle encoded in `pm` and haystack[start:stop]."""
+    v = _ALL_ONES
+    for k in range(start, stop):
+        u = v & pm[haystack[k]]
+        v = (v + u) | (v - u)
+    return _popcount64(~v & mask)
+
+
+@njit(cache=True)
+def _indel_ratio(lcs, len_a, len_b):
+    lensum = len_a + len_b
+    return 100.0 * (1.0 - (lensum - 2.0 * lcs) / lensum)
+
+
+@njit(cache=True)
+def _best_window_ratio(needle, haystack):
+    """Best Indel ratio of `needle` against every window of the (longer) haystack."""
+    m = needle.size
+    n = haystack.size
+    pm = np.zeros(256, dtype=np.uint64)
+    for i in range(m):
+        pm[needle[i]] |= _ONE << np.uint64(i)
+    mask = _ALL_ONES if m == 64 else (_ONE << np.uint64(m)) - _ONE
+
+    best = 0.0
+    # Partial windows anchored at the start of the haystack.
+    for w in range(1, m):
+        best = max(best, _indel_ratio(_lcs(pm, mask, haystack, 0, w), m, w))
+    # Full-length windows.
+    for i in range(n - m + 1):
+        best = max(best, _indel_ratio(_lcs(pm, mask, haystack, i, i + m), m, m))
+    # Partial windows anchored at the end of the haystack.
+    for i in range(n - m + 1, n):
+        best = max(best, _indel_ratio(_lcs(pm, mask, haystack, i, n), m, n - i))
+    return best
+
+
+@njit(cache=True)
+def _partial_ratio(a, b):
+    if a.size == 0 or b.size == 0:
+        return 0
+    if a.size < b.size:
+        best = _best_window_ratio(a, b)
+    elif a.size > b.size:
+        best = _best_window_ratio(b, a)
+    else:
+        best = max(_best_window_ratio(a, b), _best_window_ratio(b, a))
+    return int(np.floor(best + 0.5))
+
+
+@njit(parallel=True, cache=True)
+def partial_ratio_matrix(
+    texts_buf, text_offsets, phrases_buf, phrase_offsets, candidates
+):
+    """Return the texts x phrases uint8 partial_ratio matrix.
+
+    Pairs where `candidates` is False are left at 0 without being scored.
+    """
+    n_texts = text_offsets.size - 1
+    n_phrases = phrase_offsets.size - 1
+    scores = np.zeros((n_texts, n_phrases), dtype=np.uint8)
+    for i in prange(n_texts):
+        text = texts_buf[text_offsets[i] : text_offsets[i + 1]]
+        for j in range(n_phrases):
+            if candidates[i, j]:
+                phrase = phrases_buf[phrase_offsets[j] : phrase_offsets[j + 1]]
+                scores[i, j] = _partial_ratio(text, phrase)
+    return scores
@@ -0,0 +1,110 @@
+"""
+Parquet output for `scrape.py --format parquet`.
+
+Parquet files can't be appended to, so scraped courses are stored as a dataset
+directory: every run adds `part-<timestamp>.parquet` files and readers scan the
+whole directory. Rows are buffered and written as record batches.
+
+A part file is only readable once its footer is written on close, so parts are
+written under a hidden temporary name (skipped by dataset scans) and renamed when
+complete. A run that is killed loses at most its current part.
+"""
+from __future__ import annotations
+
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+# Rows per record batch / row group.
+BATCH_ROWS = 256
+# Rows per part file; a full part is closed and renamed so it survives a crash.
+PART_ROWS = 16 * BATCH_ROWS
+
+
+def course_schema(fieldnames: List[str]) -> pa.Schema:
+    """All course fields are (nullable) strings, matching the CSV output."""
+    return pa.schema([(name, pa.string()) for name in fieldnames])
+
+
+def load_urls(path: str) -> set[str]:
+    """Return the non-empty `url` values across every part file in the dataset."""
+    if not Path(path).is_dir():
+        return set()
+    urls = ds.dataset(path, format="parquet").to_table(columns=["url"]).column("url")
+    return {url for url in urls.to_pylist() if url}
+
+
+def _tmp_path(part: Path) -> Path:
+    """Hidden name a part is written under; dataset scans skip "."-prefixed files."""
+    return part.with_name(f".{part.name}.tmp")
+
+
+def remove(path: str) -> None:
+    """Delete the dataset directory (used by `--overwrite`)."""
+    shutil.rmtree(path, ignore_errors=True)
+
+
+class ParquetAppendWriter:
+    """
+    Writes course rows to a new part file in the dataset directory.
+
+    Exposes the `writerows` / `flush` / `close` subset of the csv writer and file
+    API that `scrape.main` uses; rows are tuples in `fieldnames` order. The part
+    file is only created once a row is written, so runs that find nothing new
+    don't leave empty files behind.
+    """
+
+    def __init__(self, path: str, fieldnames: List[str]):
+        self.path = Path(path)
+        self.fieldnames = fieldnames
+        self.schema = course_schema(fieldnames)
+        self._buffer: List[Sequence[Optional[str]]] = []
+        self._writer: Optional[pq.ParquetWriter] = None
+        # Final path of the part being written; the data goes to `_tmp_path(_part)`.
+        self._part: Optional[Path] = None
+        self._part_rows = 0
+
+    def writerows(self, rows: List[Sequence[Optional[str]]]) -> None:
+        self._buffer.extend(rows)
+        while len(self._buffer) >= BATCH_ROWS:
+            self._write_batch(self._buffer[:BATCH_ROWS])
+            del self._buffer[:BATCH_ROWS]
+
+    def flush(self) -> None:
+        if self._buffer:
+            self._write_batch(self._buffer)
+            self._buffer.clear()
+
+    def close(self) -> None:
+        self.flush()
+        self._finish_part()
+
+    def _finish_part(self) -> None:
+        """Close the current part file and move it to its final, visible name."""
+        if self._writer is None:
+            return
+        self._writer.close()
+        self._writer = None
+        os.replace(_tmp_path(self._part), self._part)
+
+    def _write_batch(self, rows: List[Sequence[Optional[str]]]) -> None:
+        if self._writer is None:
+            self.path.mkdir(parents=True, exist_ok=True)
+            self._part = self.path / f"part-{time.time_ns()}.parquet"
+            self._part_rows = 0
+            self._writer = pq.ParquetWriter(
+                _tmp_path(self._part), self.schema, compression="zstd"
+            )
+        # Rows are tuples in `fieldnames` order; transpose them into columns.
+        columns = [pa.array(column, type=pa.string()) for column in zip(*rows)]
+        batch = pa.RecordBatch.from_arrays(columns, schema=self.schema)
+        self._writer.write_batch(batch)
+        self._part_rows += len(rows)
+        if self._part_rows >= PART_ROWS:
+            self._finish_part()
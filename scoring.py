@@ -0,0 +1,301 @@
+"""
+Shared text normalization, fuzzy scoring and CSV output for the AI analysis scripts.
+
+`ai_analysis.py` and `ai_analysis_broad.py` both normalize title + description and
+fuzzy-score the result against a phrase list. That logic lives here so both scripts
+use the same pipeline, and so fuzzy scores can be cached on disk between runs.
+
+Cache layout:
+  - One parquet file per (SCORING_VERSION, phrase list, min_score) combination,
+    named by a blake2b hash of that key.
+  - Rows are keyed by a blake2b hash of the normalized text; one uint8 column per
+    phrase. New texts are scored and appended on each run.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import string
+import sys
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+from rapidfuzz import fuzz, process
+
+# Bump when normalization or scoring semantics change so stale caches are ignored.
+SCORING_VERSION = 1
+
+# Common catalog punctuation variant: "A.I." -> "ai" so word-boundary matches still work.
+AI_ABBREV_RE = re.compile(r"\ba\.\s*i\.?\b")
+NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+FUZZY_BACKENDS = ("rapidfuzz", "numba")
+ALNUM_BITS = {
+    char: 1 << bit for bit, char in enumerate(string.ascii_lowercase + string.digits)
+}
+TEXT_KEY_COL = "text_key"
+# Below this many texts the regex passes finish faster than a pool can start.
+PARALLEL_MIN_TEXTS = 2_000
+# Set-bit count of every byte value, for popcounts on NumPy < 2.0.
+BYTE_POPCOUNT = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(
+    axis=1, dtype=np.uint8
+)
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase and normalize whitespace/punctuation for reliable matching."""
+    lowered = AI_ABBREV_RE.sub("ai", text.lower())
+    cleaned = NON_ALNUM_RE.sub(" ", lowered)
+    return " ".join(cleaned.split())
+
+
+def normalize_text_series(text_series: pd.Series) -> pd.Series:
+    """Vectorized normalize_text for a whole column using pandas string kernels."""
+    # NON_ALNUM_RE collapses runs to a single space, so only the ends need trimming.
+    return (
+        text_series.str.lower()
+        .str.replace(AI_ABBREV_RE.pattern, "ai", regex=True)
+        .str.replace(NON_ALNUM_RE.pattern, " ", regex=True)
+        .str.strip()
+    )
+
+
+def factorize_normalized_text(
+    title_series: pd.Series, description_series: pd.Series
+) -> tuple[np.ndarray, pd.Series]:
+    """Normalize title + description per row and factorize the result.
+
+    Returns (codes, unique_texts) where unique_texts[codes] is the normalized text of
+    each row. The same course text repeats across terms, so callers score each
+    distinct text once and scatter results back through codes. The combined and
+    normalized per-row columns only live inside this call; the raw columns are left
+    untouched for output.
+    """
+    text_series = (
+        title_series.astype("string[pyarrow]").fillna("")
+        + " "
+        + description_series.astype("string[pyarrow]").fillna("")
+    )
+    codes, unique_texts = normalize_text_series(text_series).factorize()
+    return codes, pd.Series(unique_texts)
+
+
+def map_text_shards(
+    func: Callable[[pd.Series], np.ndarray],
+    texts: pd.Series,
+    min_texts: int = PARALLEL_MIN_TEXTS,
+) -> np.ndarray:
+    """Apply func to contiguous shards of texts in parallel and concatenate results.
+
+    func must map a text Series to a per-row array. The regex passes run in Arrow's
+    string kernels, which release the GIL, so a thread pool spreads them across
+    cores without pickling the texts into worker processes.
+    """
+    workers = os.cpu_count() or 1
+    if workers == 1 or len(texts) < min_texts:
+        return func(texts)
+    bounds = np.linspace(0, len(texts), workers + 1, dtype=np.int64)
+    shards = [texts.iloc[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return np.concatenate(list(executor.map(func, shards)))
+
+
+def char_bitmask(text_norm: str) -> int:
+    """Return a bitmask of the a-z/0-9 characters present in a normalized string."""
+    mask = 0
+    for char in set(text_norm):
+        mask |= ALNUM_BITS.get(char, 0)
+    return mask
+
+
+def popcount_bytes(values: np.ndarray) -> np.ndarray:
+    """Per-element set-bit count of a uint64 array via a byte lookup table."""
+    as_bytes = np.ascontiguousarray(values, dtype=np.uint64).view(np.uint8)
+    return BYTE_POPCOUNT[as_bytes.reshape(values.shape + (8,))].sum(
+        axis=-1, dtype=np.uint8
+    )
+
+
+def popcount(values: np.ndarray) -> np.ndarray:
+    """Per-element set-bit count; uses np.bitwise_count when NumPy >= 2.0 has it."""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(values)
+    return popcount_bytes(values)
+
+
+def fuzzy_candidate_mask(
+    texts_norm: list[str], keyword_norms: list[str], min_score: int
+) -> np.ndarray:
+    """Return a texts x phrases mask of pairs that can still reach min_score.
+
+    partial_ratio scores 200 * LCS / (len(phrase) + len(window)), and no phrase
+    character that is absent from the text can be part of the LCS. With k distinct
+    missing characters the score is therefore at most 200 * (L - k) / (2L - k), so
+    pairs missing more characters than that allows are skipped. Texts shorter than
+    the phrase are always kept because partial_ratio then slides the text instead.
+    """
+    text_bits = np.fromiter(
+        (char_bitmask(text) for text in texts_norm),
+        dtype=np.uint64,
+        count=len(texts_norm),
+    )
+    text_lens = np.fromiter(
+        (len(text) for text in texts_norm), dtype=np.int64, count=len(texts_norm)
+    )
+    phrase_bits = np.array(
+        [char_bitmask(phrase) for phrase in keyword_norms], dtype=np.uint64
+    )
+    phrase_lens = np.array([len(phrase) for phrase in keyword_norms], dtype=np.int64)
+
+    # Scores are rounded to integers, so anything >= min_score - 0.5 must be kept.
+    floor_score = min_score - 0.5
+    max_missing = 2 * phrase_lens * (100 - floor_score) / (200 - floor_score)
+    missing = popcount(phrase_bits[None, :] & ~text_bits[:, None])
+    return (missing <= max_missing[None, :]) | (
+        text_lens[:, None] < phrase_lens[None, :]
+    )
+
+
+def _numba_score_matrix(
+    texts_norm: list[str], keyword_norms: list[str], min_score: int
+) -> np.ndarray:
+    """Score the texts x phrases matrix with the Numba partial_ratio kernel."""
+    try:
+        import fuzzy_kernels
+    except ImportError:  # pragma: no cover - runtime dependency check
+        print(
+            "Missing dependency: numba. Install with: pip install numba",
+            file=sys.stderr,
+        )
+        raise SystemExit(1)
+
+    if any(len(phrase) > fuzzy_kernels.MAX_NEEDLE_LEN for phrase in keyword_norms):
+        raise ValueError(
+            f"Fuzzy phrases longer than {fuzzy_kernels.MAX_NEEDLE_LEN} characters "
+            "are not supported by the numba backend."
+        )
+    if min_score <= 0:
+        candidates = np.ones((len(texts_norm), len(keyword_norms)), dtype=bool)
+    else:
+        candidates = fuzzy_candidate_mask(texts_norm, keyword_norms, min_score)
+    texts_buf, text_offsets = fuzzy_kernels.pack_strings(texts_norm)
+    phrases_buf, phrase_offsets = fuzzy_kernels.pack_strings(keyword_norms)
+    return fuzzy_kernels.partial_ratio_matrix(
+        texts_buf, text_offsets, phrases_buf, phrase_offsets, candidates
+    )
+
+
+def _compute_score_matrix(
+    texts_norm: list[str], keyword_norms: list[str], min_score: int, backend: str
+) -> np.ndarray:
+    """Score the texts x phrases matrix with the selected backend (no caching)."""
+    if backend == "numba":
+        return _numba_score_matrix(texts_norm, keyword_norms, min_score)
+
+    if min_score <= 0:
+        return process.cdist(
+            texts_norm,
+            keyword_norms,
+            scorer=fuzz.partial_ratio,
+            dtype=np.uint8,
+            workers=-1,
+        )
+
+    texts = np.asarray(texts_norm, dtype=object)
+    candidates = fuzzy_candidate_mask(texts_norm, keyword_norms, min_score)
+    scores = np.zeros(candidates.shape, dtype=np.uint8)
+    for col, phrase in enumerate(keyword_norms):
+        rows = np.flatnonzero(candidates[:, col])
+        if rows.size:
+            scores[rows, col] = process.cdist(
+                texts[rows].tolist(),
+                [phrase],
+                scorer=fuzz.partial_ratio,
+                dtype=np.uint8,
+                workers=-1,
+            )[:, 0]
+    return scores
+
+
+def write_csv(table: pd.DataFrame | pa.Table, path: Path) -> None:
+    """Write a DataFrame/Arrow table with Arrow's C++ CSV writer.
+
+    Unlike DataFrame.to_csv, string values and headers are always quoted and booleans
+    are written as true/false.
+    """
+    if isinstance(table, pd.DataFrame):
+        table = pa.Table.from_pandas(table, preserve_index=False)
+    pacsv.write_csv(table, path)
+
+
+def _text_key(text_norm: str) -> str:
+    return hashlib.blake2b(text_norm.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _cache_path(cache_dir: Path, keyword_norms: list[str], min_score: int) -> Path:
+    key = repr((SCORING_VERSION, list(keyword_norms), max(min_score, 0)))
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+    return cache_dir / f"fuzzy_{digest}.parquet"
+
+
+def fuzzy_score_matrix(
+    texts_norm: list[str],
+    keyword_norms: list[str],
+    min_score: int = 0,
+    backend: str = "rapidfuzz",
+    cache_dir: Path | None = None,
+) -> np.ndarray:
+    """Return the texts x phrases partial_ratio matrix as uint8 scores.
+
+    Pairs that provably cannot reach min_score (see fuzzy_candidate_mask) are left at 0
+    instead of being scored. backend="numba" uses the optional JIT kernel in
+    fuzzy_kernels.py instead of RapidFuzz; both produce identical scores.
+
+    With cache_dir set, scores are looked up by text hash in the matching parquet
+    sidecar and only texts not seen before are scored (then persisted). An unreadable
+    sidecar (e.g. from an interrupted older run) is treated as empty and rebuilt.
+    """
+    if cache_dir is None:
+        return _compute_score_matrix(texts_norm, keyword_norms, min_score, backend)
+
+    path = _cache_path(cache_dir, keyword_norms, min_score)
+    phrase_cols = [str(idx) for idx in range(len(keyword_norms))]
+    cached = None
+    if path.exists():
+        try:
+            cached = pd.read_parquet(path).set_index(TEXT_KEY_COL)
+        except (OSError, pa.ArrowException):
+            print(f"Ignoring unreadable fuzzy score cache: {path}", file=sys.stderr)
+    if cached is None:
+        cached = pd.DataFrame(columns=phrase_cols, dtype=np.uint8)
+        cached.index.name = TEXT_KEY_COL
+
+    text_keys = pd.Index([_text_key(text) for text in texts_norm])
+    missing = ~text_keys.isin(cached.index)
+    if missing.any():
+        new_keys, first_pos = np.unique(
+            text_keys[missing].to_numpy(), return_index=True
+        )
+        missing_texts = np.asarray(texts_norm, dtype=object)[missing][first_pos]
+        new_scores = _compute_score_matrix(
+            missing_texts.tolist(), keyword_norms, min_score, backend
+        )
+        fresh = pd.DataFrame(
+            new_scores,
+            index=pd.Index(new_keys, name=TEXT_KEY_COL),
+            columns=phrase_cols,
+        )
+        cached = pd.concat([cached, fresh]) if len(cached) else fresh
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write aside and rename, so an interrupted run never leaves a truncated cache.
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        cached.reset_index().to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, path)
+
+    scores = cached.loc[text_keys, phrase_cols].to_numpy(dtype=np.uint8)
+    return scores.reshape(len(texts_norm), len(keyword_norms))
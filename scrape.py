@@ -13,6 +13,10 @@ flag is provided.
 Key functionalities:
 - Scrapes course details for specified academic terms.
 - Handles pagination and dynamic content loading.
+- Scrapes course pages in parallel with a pool of worker processes, each owning
+  its own browser (Selenium drivers are not thread-safe).
+- Optionally (`--fetcher http`) reads the server-rendered pages with httpx +
+  selectolax (`static_fetch.py`), falling back to Selenium per page.
 - Saves data to a CSV file (`outputs/nau_courses.csv`).
 - Logs course prefixes that yield no results (`outputs/nau_empty_prefixes.csv`).
 - Supports headless (default) and headed browser modes for scraping.
@@ -21,21 +25,31 @@ Key functionalities:
 import argparse
 import csv
 import json
+import multiprocessing
+from multiprocessing.util import Finalize
 import os
+import pickle
 import re
+import signal
+import sys
+import threading
 import time
-from dataclasses import asdict, dataclass, fields
+from collections import deque
+from dataclasses import dataclass, fields
+from itertools import islice
 from pathlib import Path
 from typing import Dict, List, Literal, Optional
 
 from selenium import webdriver
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
 from selenium.webdriver.common.by import By
+from selenium.webdriver.common.driver_finder import DriverFinder
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
     InvalidSessionIdException,
-    JavascriptException,
     NoSuchElementException,
     StaleElementReferenceException,
     TimeoutException,
@@ -57,12 +71,103 @@ TERM_CODES = {
 OUTPUT_DIR = "outputs"
 CSV_PATH = f"{OUTPUT_DIR}/nau_courses.csv"
 EMPTY_PREFIXES_CSV = f"{OUTPUT_DIR}/nau_empty_prefixes.csv"
+# Pickled set of the URLs in CSV_PATH; reused while it is newer than the CSV.
+URLS_CACHE_PATH = f"{OUTPUT_DIR}/nau_courses.urls.pkl"
+# Parquet dataset directory used instead of CSV_PATH with `--format parquet`.
+PARQUET_PATH = f"{OUTPUT_DIR}/nau_courses.parquet"
 PREFIXES_PATH = "data/prefixes.json"
 
-# Time to wait between requests to be polite to the server.
+# Minimum spacing between requests, per worker, to be polite to the server.
+# All processes share one limiter spaced SLEEP_TIME / workers apart, so the
+# overall request rate stays bounded by workers / SLEEP_TIME.
 SLEEP_TIME = 0.25
 
+# Scraped rows are written in batches through a large file buffer instead of
+# flushing after every prefix.
+WRITE_BATCH_SIZE = 64
+WRITE_BUFFER_BYTES = 1 << 16
+
+# Subresources the scraper never reads; blocked so each page load fetches only
+# the HTML and scripts.
+BLOCKED_URL_PATTERNS = [
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.svg",
+    "*.ico",
+    "*.woff",
+    "*.woff2",
+    "*.ttf",
+    "*.css",
+    "*google-analytics*",
+    "*googletagmanager*",
+]
+
+# Number of worker processes (each with its own browser) scraping course pages.
+DEFAULT_WORKERS = 4
+# After an error or Ctrl-C, how long to let pool workers finish their current page
+# (and quit their browsers) before killing them.
+ABORT_JOIN_TIMEOUT_S = 30
+# Processes (each with its own browser) prefetching results pages, in order,
+# while the course workers scrape the current prefix.
+LIST_WORKERS = 2
+
 VALID_PREFIX_RE = re.compile(r"^[A-Z&]{2,6}$")
+# "PREFIX 123 - Course Title"
+HEADER_RE = re.compile(r"^([A-Z&]{2,6})\s+(\d{3}[A-Z]?)\s*-\s*(.+)$")
+CATALOG_YEAR_RE = re.compile(r"Catalog Year\s*:\s*([0-9]{4}\s*-\s*[0-9]{4})")
+
+# How often explicit waits re-check the page (Selenium's default is 0.5s).
+WAIT_POLL_S = 0.1
+
+# Page selectors, built once instead of on every call.
+COURSE_HEADER_CSS = "#courseResults h2"
+# Reads a results page in one WebDriver round trip: whether it says "No courses
+# found", and the (absolute) href of every course link. Also used as the wait
+# condition, since the page is loaded once either of them shows up.
+COURSE_LINKS_JS = """
+const empty = Array.from(document.querySelectorAll('div#main h1')).some(
+  (h1) => h1.textContent.replace(/\\s+/g, ' ').trim() === 'No courses found'
+);
+const hrefs = Array.from(
+  document.querySelectorAll('dl#results-list dt.result-item > a'),
+  (a) => a.href
+);
+return {empty: empty, hrefs: hrefs};
+"""
+# Reads every course field in one WebDriver round trip. Labels are matched like
+# XPath normalize-space(); description/units are the first non-empty text after
+# their label, and sections are the label's following <a> siblings.
+COURSE_FIELDS_JS = """
+const squash = (text) => (text || '').replace(/\\s+/g, ' ').trim();
+const results = document.querySelector('#courseResults');
+const labels = results ? Array.from(results.querySelectorAll('strong')) : [];
+const findLabel = (label) => labels.find((el) => squash(el.textContent) === label + ':');
+const textAfter = (label) => {
+  const strong = findLabel(label);
+  for (let node = strong ? strong.nextSibling : null; node; node = node.nextSibling) {
+    const text = (node.textContent || '').trim();
+    if (text) return text;
+  }
+  return null;
+};
+const sections = [];
+const sectionsLabel = findLabel('Sections offered');
+for (let el = sectionsLabel ? sectionsLabel.nextElementSibling : null; el; el = el.nextElementSibling) {
+  const text = el.tagName === 'A' ? el.innerText.trim() : '';
+  if (text) sections.push(text);
+}
+const h2 = document.querySelector('#courseResults h2');
+const catalogHeader = document.querySelector('#h1-first');
+return {
+  header: h2 ? h2.innerText.trim() : '',
+  catalog_header: catalogHeader ? catalogHeader.innerText : null,
+  description: textAfter('Description'),
+  units: textAfter('Units'),
+  sections_offered: sections.length ? sections.join('; ') : null,
+};
+"""
 
 # =========================
 # DATA MODEL
@@ -83,14 +188,49 @@ class Course:
     url: str
 
 
+# Course field names in CSV column order. Rows are written as plain tuples in this
+# order (see `course_row`) rather than going through `asdict` + DictWriter.
+_ATTRS = tuple(field.name for field in fields(Course))
+
+
+def course_row(course: Course) -> tuple:
+    """Returns the course's field values in `_ATTRS` order."""
+    return tuple([getattr(course, attr) for attr in _ATTRS])
+
+
 # =========================
 # UTILS
 # =========================
 
 
+# Shared rate limiter state: the next free request slot (time.monotonic() seconds,
+# which is system-wide on Linux) and the spacing between slots. Pool workers get
+# the parent's values through `_init_worker`.
+_next_slot = multiprocessing.Value("d", 0.0)
+_min_interval = SLEEP_TIME
+
+
+def configure_rate_limit(next_slot, min_interval: float) -> None:
+    """Sets the shared slot counter and request spacing used by `polite_sleep`."""
+    global _next_slot, _min_interval
+    _next_slot = next_slot
+    _min_interval = min_interval
+
+
 def polite_sleep():
-    """Waits for a short period to avoid overwhelming the server."""
-    time.sleep(SLEEP_TIME)
+    """
+    Waits until the next request slot to avoid overwhelming the server.
+
+    Slots are reserved `_min_interval` apart across all processes. Time already
+    spent loading the previous page counts towards the wait, so slow pages don't
+    pay an extra fixed sleep on top.
+    """
+    with _next_slot.get_lock():
+        now = time.monotonic()
+        wait = _next_slot.value - now
+        _next_slot.value = max(now, _next_slot.value) + _min_interval
+    if wait > 0:
+        time.sleep(wait)
 
 
 def ensure_output_dirs() -> None:
@@ -99,12 +239,52 @@ def ensure_output_dirs() -> None:
     Path(EMPTY_PREFIXES_CSV).parent.mkdir(parents=True, exist_ok=True)
 
 
+# Each process runs one chromedriver, started by `chromedriver_service` on first
+# use. `make_driver` opens sessions against it, so replacing a lost session
+# doesn't restart the chromedriver process.
+#
+# `webdriver.Chrome` can't share a service between sessions (quit() stops it), so
+# `chromedriver_service` and `make_driver` mirror the setup in
+# `selenium.webdriver.chromium.webdriver.ChromiumDriver.__init__` as of Selenium
+# 4.51. Re-check them against that method when upgrading Selenium.
+_chromedriver_service: Optional[ChromeService] = None
+_chrome_binary: Optional[str] = None
+
+
+def chromedriver_service(opts: webdriver.ChromeOptions) -> ChromeService:
+    """
+    Starts this process's chromedriver on first use and returns it.
+
+    Driver and browser paths are resolved the same way `webdriver.Chrome` does,
+    but only once per process.
+    """
+    global _chromedriver_service, _chrome_binary
+    if _chromedriver_service is None:
+        service = ChromeService()
+        finder = DriverFinder(service, opts)
+        _chrome_binary = finder.get_browser_path() or None
+        service.path = service.env_path() or finder.get_driver_path()
+        service.start()
+        _chromedriver_service = service
+    return _chromedriver_service
+
+
+def stop_chromedriver_service() -> None:
+    """Stops this process's chromedriver, if one was started."""
+    global _chromedriver_service
+    if _chromedriver_service is not None:
+        _chromedriver_service.stop()
+        _chromedriver_service = None
+
+
 def make_driver(headless: bool) -> WebDriver:
     """
     Initializes and returns a Selenium WebDriver instance.
 
-    Configures the driver to run in headless mode if specified and sets a
-    default window size.
+    Configures the driver to run in headless mode if specified, sets a default
+    window size, and blocks images, fonts, stylesheets and analytics (only page
+    text is scraped). The session runs on the process's shared chromedriver and
+    talks to it over a keep-alive connection pool; `quit()` ends the session only.
 
     Returns:
         WebDriver: The configured Selenium WebDriver instance.
@@ -113,7 +293,34 @@ def make_driver(headless: bool) -> WebDriver:
     if headless:
         opts.add_argument("--headless=new")
     opts.add_argument("--window-size=1400,900")
-    return webdriver.Chrome(options=opts)
+    # Return from driver.get() at DOMContentLoaded instead of window.onload; the
+    # explicit WebDriverWaits already wait for the nodes that are actually read.
+    opts.page_load_strategy = "eager"
+    opts.add_argument("--disable-gpu")
+    opts.add_argument("--disable-dev-shm-usage")
+    opts.add_argument("--blink-settings=imagesEnabled=false")
+    opts.add_experimental_option(
+        "prefs",
+        {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.stylesheets": 2,
+        },
+    )
+    service = chromedriver_service(opts)
+    if _chrome_binary:
+        opts.binary_location = _chrome_binary
+        opts.browser_version = None
+    executor = ChromiumRemoteConnection(
+        remote_server_addr=service.service_url,
+        vendor_prefix="goog",
+        browser_name="chrome",
+        keep_alive=True,
+        ignore_proxy=opts._ignore_local_proxy,
+    )
+    driver = webdriver.Remote(command_executor=executor, options=opts)
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    return driver
 
 
 def results_url(prefix: str, term_code: int) -> str:
@@ -134,18 +341,38 @@ def load_existing_urls() -> set[str]:
     """
     Loads existing course URLs from the CSV file into a set.
 
+    The set is cached in `URLS_CACHE_PATH` and reused as long as the cache is at
+    least as new as the CSV; any write to the CSV makes the next load re-read it.
+
     Returns:
         set[str]: A set of course URLs. Returns an empty set if the file
                   does not exist.
     """
     existing = set()
     try:
+        csv_mtime = os.stat(CSV_PATH).st_mtime_ns
+        if os.path.exists(URLS_CACHE_PATH) and (
+            os.stat(URLS_CACHE_PATH).st_mtime_ns >= csv_mtime
+        ):
+            try:
+                with open(URLS_CACHE_PATH, "rb") as f:
+                    existing = pickle.load(f)
+                print(
+                    f"Loaded {len(existing)} existing courses from {URLS_CACHE_PATH}"
+                )
+                return existing
+            except (OSError, EOFError, pickle.UnpicklingError):
+                pass  # Fall back to re-reading the CSV below.
+
         with open(CSV_PATH, newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                url = row.get("url")
-                if url:
-                    existing.add(url)
+            # Only the url column is needed, so read plain rows instead of a dict per row.
+            reader = csv.reader(f)
+            header = next(reader, [])
+            if "url" in header:
+                idx = header.index("url")
+                existing = {row[idx] for row in reader if len(row) > idx and row[idx]}
+        with open(URLS_CACHE_PATH, "wb") as f:
+            pickle.dump(existing, f, protocol=5)
         print(f"Loaded {len(existing)} existing courses from {CSV_PATH}")
     except FileNotFoundError:
         print(f"No existing CSV found at {CSV_PATH} — starting fresh.")
@@ -254,52 +481,67 @@ def write_csv(rows: Dict[str, Dict]):
         writer.writerows(rows.values())
 
 
-def open_append_writer(fieldnames: List[str]) -> tuple[csv.DictWriter, object]:
+def open_append_writer(fieldnames: List[str]) -> tuple[csv.writer, object]:
     """
     Opens the CSV file in append mode and writes a header if needed.
 
     Returns:
-        tuple[csv.DictWriter, object]: The writer and the file handle (caller closes).
+        tuple[csv.writer, object]: The writer and the file handle (caller closes).
+            Rows are tuples in `fieldnames` order.
     """
     ensure_output_dirs()
     needs_header = not os.path.exists(CSV_PATH) or os.path.getsize(CSV_PATH) == 0
-    f = open(CSV_PATH, "a", newline="", encoding="utf-8")
-    writer = csv.DictWriter(f, fieldnames=fieldnames)
+    f = open(
+        CSV_PATH, "a", buffering=WRITE_BUFFER_BYTES, newline="", encoding="utf-8"
+    )
+    writer = csv.writer(f)
     if needs_header:
+        writer.writerow(fieldnames)
+    return writer, f
+
+
+def open_empty_prefix_writer() -> tuple[csv.DictWriter, object]:
+    """
+    Opens the empty-prefix log in append mode and writes a header if needed.
+
+    The log is opened once per run and shared by every `log_empty_prefix` call.
+
+    Returns:
+        tuple[csv.DictWriter, object]: The writer and the file handle (caller closes).
+    """
+    ensure_output_dirs()
+    write_header = (
+        not os.path.exists(EMPTY_PREFIXES_CSV)
+        or os.path.getsize(EMPTY_PREFIXES_CSV) == 0
+    )
+    f = open(EMPTY_PREFIXES_CSV, "a", buffering=1 << 14, newline="", encoding="utf-8")
+    writer = csv.DictWriter(f, fieldnames=["term", "term_code", "prefix", "error"])
+    if write_header:
         writer.writeheader()
     return writer, f
 
 
-def log_empty_prefix(term_label: str, term_code: int, prefix: str, error: str):
+def log_empty_prefix(
+    writer: csv.DictWriter, term_label: str, term_code: int, prefix: str, error: str
+):
     """
     Logs a course prefix that returned no results to a separate CSV file.
 
     Args:
+        writer (csv.DictWriter): Writer from `open_empty_prefix_writer`.
         term_label (str): The human-readable academic term.
         term_code (int): The internal term code.
         prefix (str): The course prefix that was empty.
         error (str): A short description of why it's considered empty.
     """
-    # Create the file and write the header if it doesn't exist.
-    ensure_output_dirs()
-    write_header = (
-        not os.path.exists(EMPTY_PREFIXES_CSV)
-        or os.path.getsize(EMPTY_PREFIXES_CSV) == 0
+    writer.writerow(
+        {
+            "term": term_label,
+            "term_code": term_code,
+            "prefix": prefix,
+            "error": error,
+        }
     )
-    with open(EMPTY_PREFIXES_CSV, "a", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(
-            f, fieldnames=["term", "term_code", "prefix", "error"]
-        )
-        if write_header:
-            writer.writeheader()
-        writer.writerow(
-            {
-                "term": term_label,
-                "term_code": term_code,
-                "prefix": prefix,
-                "error": error,
-            }
-        )
 
 
 # =========================
@@ -307,6 +549,12 @@ def log_empty_prefix(term_label: str, term_code: int, prefix: str, error: str):
 # =========================
 
 
+def _loaded_course_links(driver: WebDriver) -> Optional[dict]:
+    """Wait condition: the COURSE_LINKS_JS result once the results page has loaded."""
+    page = driver.execute_script(COURSE_LINKS_JS)
+    return page if page["empty"] or page["hrefs"] else None
+
+
 def get_course_links(
     driver: WebDriver,
     prefix: str,
@@ -330,42 +578,44 @@ def get_course_links(
             - "empty": results page confirmed "No courses found"
             - "timeout": results page did not load after retries
             - "error": unexpected Selenium/WebDriver error
+
+    Raises:
+        InvalidSessionIdException: If the driver's session is gone; the caller has
+            to replace the driver.
     """
     for attempt in range(retries + 1):
         try:
             driver.get(results_url(prefix, term_code))
-            wait = WebDriverWait(driver, wait_s)
-
-            # Wait for either the course list or the "no courses found" message.
-            wait.until(
-                EC.any_of(
-                    EC.presence_of_element_located(
-                        (By.CSS_SELECTOR, "dl#results-list dt.result-item > a")
-                    ),
-                    EC.presence_of_element_located(
-                        (By.XPATH, "//div[@id='main']//h1[normalize-space()='No courses found']")
-                    ),
-                )
+            wait = WebDriverWait(
+                driver,
+                wait_s,
+                poll_frequency=WAIT_POLL_S,
+                ignored_exceptions=(StaleElementReferenceException,),
             )
+
+            # Wait for either the course list or the "no courses found" message;
+            # the last poll's result is the page data.
+            page = wait.until(_loaded_course_links)
         except TimeoutException:
             if attempt < retries:
                 print(f"[WARN] Timeout on {prefix} list page, retrying...")
                 continue
             print(f"[WARN] {prefix} list timed out after {retries} retries; skipping.")
             return [], "timeout"
+        except InvalidSessionIdException:
+            raise
         except WebDriverException as e:
             print(f"[WARN] Failed to load list page for {prefix}: {type(e).__name__}: {e}")
             return [], "error"
 
         # If the "no courses found" message is present, return an empty list.
-        if driver.find_elements(By.XPATH, "//div[@id='main']//h1[normalize-space()='No courses found']"):
+        if page["empty"]:
             polite_sleep()
             return [], "empty"
 
         # Collect all unique course links from the page.
         links = set()
-        for a in driver.find_elements(By.CSS_SELECTOR, "dl#results-list dt.result-item > a"):
-            href = a.get_attribute("href")
+        for href in page["hrefs"]:
             if href:
                 # Ensure the URL is absolute.
                 if href.startswith("course?"):
@@ -373,90 +623,41 @@ def get_course_links(
                 links.add(href)
 
         polite_sleep()
-        return sorted(list(links)), "ok"
+        return list(links), "ok"
 
     return [], "error"
 
 
-def text_after_label(driver: WebDriver, label: str) -> Optional[str]:
+def parse_catalog_year(header_text: Optional[str]) -> Optional[str]:
     """
-    Extracts the text content immediately following a bolded label element.
-
-    This is used to get fields like "Description:" or "Units:".
+    Parses the catalog year out of the page header text.
 
     Args:
-        driver (WebDriver): The Selenium driver.
-        label (str): The text of the label to find (e.g., "Description").
-
-    Returns:
-        Optional[str]: The text content, or None if the label isn't found.
-    """
-    try:
-        strong_element = driver.find_element(
-            By.XPATH,
-            f"//div[@id='courseResults']//strong[normalize-space()='{label}:']",
-        )
-    except NoSuchElementException:
-        return None
-
-    # Use JavaScript to get the next sibling text node's content.
-    # This is more robust for handling variations in spacing and nested elements.
-    try:
-        return driver.execute_script(
-            """
-            let node = arguments[0].nextSibling;
-            while (node) {
-              const text = (node.textContent || '').trim();
-              if (text) return text;
-              node = node.nextSibling;
-            }
-            return null;
-            """,
-            strong_element,
-        )
-    except (JavascriptException, WebDriverException):
-        return None
-
-
-def get_catalog_year(driver: WebDriver) -> Optional[str]:
-    """
-    Extracts the catalog year from the course page header.
-
-    Args:
-        driver (WebDriver): The Selenium driver.
+        header_text (Optional[str]): The text of the `#h1-first` header.
 
     Returns:
         Optional[str]: The catalog year (e.g., "2023-2024"), or None.
     """
-    try:
-        header_text = driver.find_element(By.CSS_SELECTOR, "#h1-first").text
-        match = re.search(r"Catalog Year\s*:\s*([0-9]{4}\s*-\s*[0-9]{4})", header_text)
-        if match:
-            return match.group(1).replace(" ", "")
-    except (NoSuchElementException, StaleElementReferenceException):
-        pass
+    if not header_text:
+        return None
+    match = CATALOG_YEAR_RE.search(header_text)
+    if match:
+        return match.group(1).replace(" ", "")
     return None
 
 
-def get_sections_offered(driver: WebDriver) -> Optional[str]:
+def parse_header(header: str) -> tuple[str, str, str]:
     """
-    Extracts the "Sections offered" links from the course page.
-
-    Args:
-        driver (WebDriver): The Selenium driver.
+    Splits a course header like "ACC 255 - Financial Accounting".
 
     Returns:
-        Optional[str]: A semicolon-separated string of section terms, or None.
+        tuple[str, str, str]: (prefix, number, title); prefix and number are empty
+            and the whole header is the title if it doesn't match.
     """
-    try:
-        anchors = driver.find_elements(
-            By.XPATH,
-            "//div[@id='courseResults']//strong[normalize-space()='Sections offered:']/following-sibling::a",
-        )
-        texts = [a.text.strip() for a in anchors if a.text.strip()]
-        return "; ".join(texts) if texts else None
-    except (StaleElementReferenceException, WebDriverException):
-        return None
+    match = HEADER_RE.match(header)
+    if match:
+        return match.group(1), match.group(2), match.group(3).strip()
+    return "", "", header
 
 
 def scrape_course(driver: WebDriver, url: str, term_label: str) -> Course:
@@ -472,34 +673,316 @@ def scrape_course(driver: WebDriver, url: str, term_label: str) -> Course:
         Course: A `Course` dataclass instance with the scraped information.
     """
     driver.get(url)
-    wait = WebDriverWait(driver, 15)
+    wait = WebDriverWait(driver, 15, poll_frequency=WAIT_POLL_S)
 
     # The main header contains the prefix, number, and title.
-    h2 = wait.until(
-        EC.presence_of_element_located((By.CSS_SELECTOR, "#courseResults h2"))
-    )
-    header = h2.text.strip()
+    wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, COURSE_HEADER_CSS)))
+    # All fields come back from a single script call instead of one WebDriver
+    # command per field.
+    course = course_from_page(url, term_label, driver.execute_script(COURSE_FIELDS_JS))
+
+    polite_sleep()
+    return course
 
-    # Regex to parse "PREFIX 123 - Course Title"
-    match = re.match(r"^([A-Z&]{2,6})\s+(\d{3}[A-Z]?)\s*-\s*(.+)$", header)
-    prefix, number, title = ("", "", header)
-    if match:
-        prefix, number, title = match.group(1), match.group(2), match.group(3).strip()
 
-    course = Course(
+def course_from_page(url: str, term_label: str, page: Dict[str, Optional[str]]) -> Course:
+    """
+    Builds a `Course` from raw page fields.
+
+    `page` comes from `COURSE_FIELDS_JS` or `static_fetch.parse_course_page`.
+    """
+    prefix, number, title = parse_header(page["header"] or "")
+    return Course(
         term=term_label,
-        catalog_year=get_catalog_year(driver),
+        catalog_year=parse_catalog_year(page["catalog_header"]),
         prefix=prefix,
         number=number,
         title=title,
-        description=text_after_label(driver, "Description"),
-        units=text_after_label(driver, "Units"),
-        sections_offered=get_sections_offered(driver),
+        description=page["description"],
+        units=page["units"],
+        sections_offered=page["sections_offered"],
         url=url,
     )
 
-    polite_sleep()
-    return course
+
+def import_parquet_store():
+    """Imports `parquet_store`, exiting if pyarrow is missing."""
+    try:
+        # Local import so CSV runs don't need pyarrow.
+        import parquet_store
+    except ImportError:
+        print(
+            "Missing dependency: pyarrow. Install with: pip install pyarrow",
+            file=sys.stderr,
+        )
+        raise SystemExit(1)
+    return parquet_store
+
+
+def make_static_fetcher(concurrency: int):
+    """Creates a `static_fetch.StaticFetcher`, exiting if its dependencies are missing."""
+    try:
+        # Local import so Selenium-only runs don't need httpx/selectolax.
+        from static_fetch import StaticFetcher
+    except ImportError:
+        print(
+            "Missing dependency: httpx/selectolax. Install with: pip install httpx selectolax",
+            file=sys.stderr,
+        )
+        raise SystemExit(1)
+    return StaticFetcher(concurrency, SLEEP_TIME)
+
+
+# =========================
+# WORKER POOL
+# =========================
+
+# Each pool worker owns one driver, created by `_init_worker`. If Chrome can't be
+# started the error is kept in `_worker_driver_error` instead of being raised:
+# an initializer that raises makes the Pool respawn the worker forever.
+_worker_driver: Optional[WebDriver] = None
+_worker_driver_error: Optional[str] = None
+_worker_headless = True
+# Set by `Browsers.close(abort=True)`; workers then skip their queued tasks.
+_worker_stop = None
+
+
+def _quit_worker_driver() -> None:
+    """Quit the worker's driver, ignoring errors from an already-dead session."""
+    global _worker_driver
+    if _worker_driver is None:
+        return
+    try:
+        _worker_driver.quit()
+    except Exception:
+        pass  # Driver may already be gone
+    _worker_driver = None
+
+
+def _restart_worker_driver() -> None:
+    """(Re)starts the worker's driver, recording the error if that fails."""
+    global _worker_driver, _worker_driver_error
+    _quit_worker_driver()
+    try:
+        _worker_driver = make_driver(headless=_worker_headless)
+        _worker_driver_error = None
+    except Exception as e:
+        _worker_driver_error = f"{type(e).__name__}: {e}"
+
+
+def _require_worker_driver() -> WebDriver:
+    """
+    Returns the worker's driver.
+
+    Raises:
+        RuntimeError: If the driver couldn't be started. The Pool re-raises it in
+            the parent, which stops the run instead of retrying every task.
+    """
+    if _worker_driver is None:
+        raise RuntimeError(f"Could not start WebDriver: {_worker_driver_error}")
+    return _worker_driver
+
+
+def _init_worker(headless: bool, next_slot, min_interval: float, stop) -> None:
+    """Pool initializer: start this worker's driver and quit it on worker exit."""
+    global _worker_headless, _worker_stop, _chromedriver_service
+    # Ctrl-C is handled by the parent (see `Browsers.close`). A worker killed by
+    # it mid-task never reports that task, which makes pool.join() hang.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    configure_rate_limit(next_slot, min_interval)
+    _worker_stop = stop
+    # A forked worker inherits the parent's chromedriver handle; start its own.
+    _chromedriver_service = None
+    _worker_headless = headless
+    _restart_worker_driver()
+    # Finalizers with equal priority run in reverse order: quit, then stop.
+    Finalize(None, stop_chromedriver_service, exitpriority=10)
+    Finalize(None, _quit_worker_driver, exitpriority=10)
+
+
+def _scrape_one(task: tuple[str, str]) -> tuple[str, Optional[tuple], Optional[str]]:
+    """
+    Scrapes one course page with the worker's driver.
+
+    Args:
+        task (tuple[str, str]): The course URL and the human-readable academic term.
+
+    Returns:
+        tuple[str, Optional[tuple], Optional[str]]: (url, row, warning). `row` is the
+            course from `course_row`, or None if scraping failed and `warning` says why.
+    """
+    url, term_label = task
+    if _worker_stop.is_set():
+        return url, None, f"Skipped {url}: scraping was stopped."
+    try:
+        course = scrape_course(_require_worker_driver(), url, term_label)
+        return url, course_row(course), None
+    except InvalidSessionIdException:
+        _restart_worker_driver()
+        # The current link is skipped, but it will be picked up on a future run
+        # because it hasn't been added to `seen_urls`.
+        return url, None, (
+            f"WebDriver session lost while scraping {url}. Restarted driver."
+        )
+    except (
+        TimeoutException,
+        NoSuchElementException,
+        StaleElementReferenceException,
+        WebDriverException,
+    ) as e:
+        return url, None, f"Failed to scrape {url}: {type(e).__name__}: {e}"
+
+
+def _list_one(task: tuple[int, str]) -> tuple[list[str], str]:
+    """Fetches one results page with the worker's driver; see `get_course_links`."""
+    term_code, prefix = task
+    if _worker_stop.is_set():
+        return [], "error"
+    try:
+        return get_course_links(_require_worker_driver(), prefix, term_code)
+    except InvalidSessionIdException:
+        _restart_worker_driver()
+        # Logged as an error, so the prefix is fetched again on the next run.
+        print(f"[WARN] WebDriver session lost while listing {prefix}. Restarted driver.")
+        return [], "error"
+
+
+class Browsers:
+    """
+    Starts the list-page driver(s) and the worker pool on first use.
+
+    With `--fetcher http` most runs never need a browser, so none is launched
+    unless a page has to fall back to Selenium.
+    """
+
+    def __init__(self, headless: bool, workers: int, list_workers: int = 1):
+        self.headless = headless
+        self.workers = max(1, workers)
+        self.list_workers = max(1, list_workers)
+        self._driver: Optional[WebDriver] = None
+        self._pool = None
+        self._list_pool = None
+        self._stop = multiprocessing.Event()
+
+    @property
+    def driver(self) -> WebDriver:
+        if self._driver is None:
+            self._driver = make_driver(headless=self.headless)
+        return self._driver
+
+    def restart_driver(self) -> None:
+        """Quits the main-process driver (if any); the next `driver` access starts a new one."""
+        if self._driver is not None:
+            try:
+                self._driver.quit()
+            except Exception:
+                pass  # Driver may already be gone
+            self._driver = None
+
+    @property
+    def pool(self):
+        if self._pool is None:
+            self._pool = multiprocessing.Pool(
+                processes=self.workers,
+                initializer=_init_worker,
+                initargs=(self.headless, _next_slot, _min_interval, self._stop),
+            )
+        return self._pool
+
+    @property
+    def list_pool(self):
+        """Pool of `list_workers` processes with one results-page driver each."""
+        if self._list_pool is None:
+            self._list_pool = multiprocessing.Pool(
+                processes=self.list_workers,
+                initializer=_init_worker,
+                initargs=(self.headless, _next_slot, _min_interval, self._stop),
+            )
+        return self._list_pool
+
+    def close(self, abort: bool = False) -> None:
+        """
+        Quits the driver and shuts down the pools.
+
+        Args:
+            abort (bool): Set after an error or Ctrl-C. Workers skip the tasks still
+                queued, and pools that haven't exited after ABORT_JOIN_TIMEOUT_S are
+                terminated.
+        """
+        if abort:
+            self._stop.set()
+        self.restart_driver()
+        for pool in (self._list_pool, self._pool):
+            if pool is None:
+                continue
+            # close + join (not terminate) so each worker's Finalize quits its driver.
+            pool.close()
+            if not abort:
+                pool.join()
+                continue
+            joiner = threading.Thread(target=pool.join, daemon=True)
+            joiner.start()
+            joiner.join(ABORT_JOIN_TIMEOUT_S)
+            if joiner.is_alive():
+                print("[WARN] Pool workers did not exit in time; terminating them.")
+                pool.terminate()
+        stop_chromedriver_service()
+
+
+def course_listings(browsers: Browsers, fetcher, tasks: List[tuple[int, str]]):
+    """
+    Yields (links, status) for each (term_code, prefix) task, in task order.
+
+    Without a static fetcher the results pages are prefetched by the list-page
+    pool: the next few pages in task order load while `main` scrapes the current
+    prefix's courses. At most two pages per list worker are in flight, which keeps
+    shutdown quick (pool.join waits for queued tasks). The static fetcher reads
+    pages over HTTP and falls back to the main driver.
+    """
+    if fetcher is None:
+        remaining = iter(tasks)
+        in_flight = deque(
+            browsers.list_pool.apply_async(_list_one, (task,))
+            for task in islice(remaining, 2 * browsers.list_workers)
+        )
+        while in_flight:
+            listing = in_flight.popleft().get()
+            for task in islice(remaining, 1):
+                in_flight.append(browsers.list_pool.apply_async(_list_one, (task,)))
+            yield listing
+        return
+    for term_code, prefix in tasks:
+        listing = fetcher.course_links(results_url(prefix, term_code))
+        if listing is None:
+            try:
+                listing = get_course_links(browsers.driver, prefix, term_code)
+            except InvalidSessionIdException:
+                browsers.restart_driver()
+                print(
+                    f"[WARN] WebDriver session lost while listing {prefix}. Restarted driver."
+                )
+                listing = [], "error"
+        yield listing
+
+
+def scrape_links(browsers: Browsers, fetcher, links: List[str], term_label: str):
+    """
+    Yields (url, row, warning) for each course link.
+
+    Links are read with the static fetcher first when one is given; pages it can't
+    parse, and every page without one, go to the Selenium worker pool.
+    """
+    browser_links = links
+    if fetcher is not None:
+        browser_links = []
+        for url, page in fetcher.course_pages(links):
+            if page is None:
+                browser_links.append(url)
+                continue
+            yield url, course_row(course_from_page(url, term_label, page)), None
+    if browser_links:
+        tasks = [(link, term_label) for link in browser_links]
+        yield from browsers.pool.imap_unordered(_scrape_one, tasks, chunksize=4)
 
 
 # =========================
@@ -524,6 +1007,30 @@ def parse_args() -> argparse.Namespace:
         default=PREFIXES_PATH,
         help="Path to JSON file with course prefixes.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Number of browser worker processes (default: {DEFAULT_WORKERS}).",
+    )
+    parser.add_argument(
+        "--fetcher",
+        choices=("selenium", "http"),
+        default="selenium",
+        help=(
+            "How to load pages: 'http' uses httpx + selectolax and only falls back "
+            "to Selenium for pages it can't parse (default: selenium)."
+        ),
+    )
+    parser.add_argument(
+        "--format",
+        choices=("csv", "parquet"),
+        default="csv",
+        help=(
+            f"Course output format: {CSV_PATH} or the {PARQUET_PATH} dataset "
+            "directory; parquet requires pyarrow (default: csv)."
+        ),
+    )
     return parser.parse_args()
 
 
@@ -537,41 +1044,76 @@ def main():
     args = parse_args()
     ensure_output_dirs()
     prefixes = load_prefixes(args.prefixes)
-    driver = make_driver(headless=not args.no_headless)
+    browsers = Browsers(
+        headless=not args.no_headless,
+        workers=args.workers,
+        list_workers=LIST_WORKERS,
+    )
+    configure_rate_limit(multiprocessing.Value("d", 0.0), SLEEP_TIME / browsers.workers)
+    # The HTTP path uses the same concurrency budget as the browser pool.
+    fetcher = make_static_fetcher(browsers.workers) if args.fetcher == "http" else None
 
-    fieldnames = [field.name for field in fields(Course)]
+    fieldnames = list(_ATTRS)
     existing_urls: set[str] = set()
     seen_urls: set[str] = set()
     logged_empty: set[tuple[str, str, str]] = set()
-    writer: csv.DictWriter | None = None
+    writer: csv.writer | None = None
     out_file = None
+    # Rows waiting to be written; see WRITE_BATCH_SIZE.
+    pending: list[tuple] = []
+
+    parquet_store = import_parquet_store() if args.format == "parquet" else None
 
     if args.overwrite:
-        print("Overwrite enabled: will stream-write a fresh CSV.")
+        print(f"Overwrite enabled: will stream-write a fresh {args.format.upper()}.")
         # Start fresh for both output files.
-        Path(CSV_PATH).unlink(missing_ok=True)
         Path(EMPTY_PREFIXES_CSV).unlink(missing_ok=True)
-
-        out_file = open(CSV_PATH, "w", newline="", encoding="utf-8")
-        writer = csv.DictWriter(out_file, fieldnames=fieldnames)
-        writer.writeheader()
+        if parquet_store is not None:
+            parquet_store.remove(PARQUET_PATH)
+        else:
+            Path(CSV_PATH).unlink(missing_ok=True)
+            Path(URLS_CACHE_PATH).unlink(missing_ok=True)
+            out_file = open(
+                CSV_PATH, "w", buffering=WRITE_BUFFER_BYTES, newline="", encoding="utf-8"
+            )
+            writer = csv.writer(out_file)
+            writer.writerow(fieldnames)
     else:
-        existing_urls = load_existing_urls()
+        if parquet_store is not None:
+            existing_urls = parquet_store.load_urls(PARQUET_PATH)
+            print(f"Loaded {len(existing_urls)} existing courses from {PARQUET_PATH}")
+        else:
+            existing_urls = load_existing_urls()
+            writer, out_file = open_append_writer(fieldnames)
         seen_urls = set(existing_urls)
         logged_empty = load_existing_empty_prefix_keys()
-        writer, out_file = open_append_writer(fieldnames)
+    if parquet_store is not None:
+        # Same writerows/flush/close surface as the CSV writer + file pair.
+        writer = out_file = parquet_store.ParquetAppendWriter(PARQUET_PATH, fieldnames)
+    empty_writer, empty_file = open_empty_prefix_writer()
 
+    completed = False
     try:
         total_prefixes = len(prefixes) * len(TERM_CODES)
         step = 1
         new_total = 0
 
+        listings = course_listings(
+            browsers,
+            fetcher,
+            [
+                (term_code, prefix)
+                for term_code in TERM_CODES.values()
+                for prefix in prefixes
+            ],
+        )
+
         for term_label, term_code in TERM_CODES.items():
             for prefix in prefixes:
                 print(
                     f"[{step}/{total_prefixes}] {term_label} {prefix}: fetching list..."
                 )
-                links, status = get_course_links(driver, prefix, term_code)
+                links, status = next(listings)
                 print(
                     f"[{step}/{total_prefixes}] {term_label} {prefix}: {len(links)} courses found"
                 )
@@ -581,65 +1123,64 @@ def main():
                     key = (str(term_code), prefix, error_value)
                     if key not in logged_empty:
                         # Preserve the status so gaps can distinguish "empty" from transient failures.
-                        log_empty_prefix(term_label, term_code, prefix, error_value)
+                        log_empty_prefix(
+                            empty_writer, term_label, term_code, prefix, error_value
+                        )
                         logged_empty.add(key)
                     step += 1
                     continue
 
-                new_count = 0
-                for link in links:
-                    # Skip if we've already seen this course (existing or earlier in run).
-                    if link in seen_urls:
-                        continue
+                # Skip courses we've already seen (existing or earlier in run), and the
+                # whole prefix when nothing is new.
+                new_links = [link for link in links if link not in seen_urls]
+                if not new_links:
+                    step += 1
+                    continue
 
-                    try:
-                        course = scrape_course(driver, link, term_label)
-                        row = asdict(course)
-                        if writer is None:
-                            raise RuntimeError("CSV writer not initialized")
-                        writer.writerow(row)
-                        seen_urls.add(link)
-                        new_count += 1
-                    except InvalidSessionIdException as e:
-                        print(
-                            f"[WARN] WebDriver session lost while scraping {link}. "
-                            "Restarting driver..."
-                        )
-                        try:
-                            driver.quit()
-                        except Exception:
-                            pass  # Driver may already be gone
-                        driver = make_driver(headless=not args.no_headless)
-                        # The current link is skipped, but it will be picked up on a future run
-                        # because it hasn't been added to `seen_urls`.
+                new_count = 0
+                for link, row, warning in scrape_links(
+                    browsers, fetcher, new_links, term_label
+                ):
+                    if row is None:
+                        print(f"[WARN] {warning}")
                         continue
-                    except (
-                        TimeoutException,
-                        NoSuchElementException,
-                        StaleElementReferenceException,
-                        WebDriverException,
-                    ) as e:
-                        print(
-                            f"[WARN] Failed to scrape {link}: {type(e).__name__}: {e}"
-                        )
+                    if writer is None:
+                        raise RuntimeError("CSV writer not initialized")
+                    pending.append(row)
+                    if len(pending) >= WRITE_BATCH_SIZE:
+                        writer.writerows(pending)
+                        pending.clear()
+                    seen_urls.add(link)
+                    new_count += 1
 
                 if new_count > 0:
                     new_total += new_count
                     print(
                         f"[{step}/{total_prefixes}] {term_label} {prefix}: Scraped {new_count} new/updated courses"
                     )
-                    if out_file:
-                        out_file.flush()
 
                 step += 1
 
+        completed = True
     finally:
-        print("Scraping finished. Shutting down WebDriver.")
-        driver.quit()
-        if out_file:
-            out_file.close()
-
-    print(f"Finished. Total courses in CSV: {len(seen_urls)}")
+        # Save scraped rows before shutting down browsers: joining the pools can take
+        # a while after an interrupt, and a failing shutdown mustn't lose rows.
+        try:
+            if writer is not None and pending:
+                writer.writerows(pending)
+            if out_file:
+                out_file.flush()
+                out_file.close()
+            empty_file.close()
+        finally:
+            print("Scraping finished. Shutting down WebDriver.")
+            try:
+                browsers.close(abort=not completed)
+            finally:
+                if fetcher is not None:
+                    fetcher.close()
+
+    print(f"Finished. Total courses in {args.format.upper()}: {len(seen_urls)}")
 
 
 if __name__ == "__main__":
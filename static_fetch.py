@@ -0,0 +1,171 @@
+"""
+Static-HTML fetch path for `scrape.py --fetcher http`.
+
+The catalog's results and course pages are server-rendered, so they can be read
+with async HTTP requests and a C-backed HTML parser instead of a full browser.
+Pages that don't contain the expected nodes (for example a JS gate or an error
+page) are reported back as None so `scrape.py` can retry them with Selenium.
+
+The helpers mirror the Selenium path in `scrape.py`:
+- `parse_course_links` matches `get_course_links`.
+- `parse_course_page` returns the same fields as `scrape.COURSE_FIELDS_JS`.
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import Dict, List, Literal, Optional, Tuple
+from urllib.parse import urljoin
+
+import httpx
+from selectolax.lexbor import LexborHTMLParser
+
+LIST_LINK_CSS = "dl#results-list dt.result-item > a"
+NO_COURSES_TEXT = "No courses found"
+
+CoursePage = Dict[str, Optional[str]]
+
+
+def _squash(text: str) -> str:
+    """Collapse whitespace like a browser's rendered `.text` / XPath normalize-space."""
+    return " ".join(text.split())
+
+
+def parse_course_links(
+    html: str, page_url: str
+) -> Optional[Tuple[List[str], Literal["ok", "empty"]]]:
+    """
+    Extracts course links from a results page.
+
+    Returns:
+        Optional[tuple[list[str], str]]: (links, "ok"), ([], "empty") when the page
+            says "No courses found", or None if neither is present.
+    """
+    tree = LexborHTMLParser(html)
+    if any(_squash(h1.text()) == NO_COURSES_TEXT for h1 in tree.css("div#main h1")):
+        return [], "empty"
+
+    anchors = tree.css(LIST_LINK_CSS)
+    if not anchors:
+        return None
+    # Resolve relative hrefs (e.g. "course?...") the way the browser's `href` does.
+    links = {
+        urljoin(page_url, href)
+        for href in (a.attributes.get("href") for a in anchors)
+        if href
+    }
+    return list(links), "ok"
+
+
+def _text_after_label(results, label: str) -> Optional[str]:
+    """First non-empty text after a label, like `textAfter` in COURSE_FIELDS_JS."""
+    for strong in results.css("strong"):
+        if _squash(strong.text()) != f"{label}:":
+            continue
+        node = strong.next
+        while node is not None:
+            text = node.text().strip()
+            if text:
+                return text
+            node = node.next
+        return None
+    return None
+
+
+def _sections_offered(results) -> Optional[str]:
+    """The label's following <a> siblings, like COURSE_FIELDS_JS."""
+    for strong in results.css("strong"):
+        if _squash(strong.text()) != "Sections offered:":
+            continue
+        texts = []
+        node = strong.next
+        while node is not None:
+            if node.tag == "a":
+                text = _squash(node.text())
+                if text:
+                    texts.append(text)
+            node = node.next
+        return "; ".join(texts) if texts else None
+    return None
+
+
+def parse_course_page(html: str) -> Optional[CoursePage]:
+    """
+    Extracts the raw course fields from a course page.
+
+    Returns:
+        Optional[dict]: header, catalog_header, description, units and
+            sections_offered, or None if the course header is missing.
+    """
+    tree = LexborHTMLParser(html)
+    results = tree.css_first("#courseResults")
+    h2 = results.css_first("h2") if results is not None else None
+    if h2 is None:
+        return None
+
+    catalog_header = tree.css_first("#h1-first")
+    return {
+        "header": _squash(h2.text()),
+        "catalog_header": (
+            _squash(catalog_header.text()) if catalog_header is not None else None
+        ),
+        "description": _text_after_label(results, "Description"),
+        "units": _text_after_label(results, "Units"),
+        "sections_offered": _sections_offered(results),
+    }
+
+
+class StaticFetcher:
+    """
+    Fetches catalog pages over HTTP with bounded concurrency.
+
+    Requests run on a private event loop so `scrape.py` can stay synchronous. Each
+    request holds one of `concurrency` slots for its response plus `sleep_s`, which
+    keeps the request rate at or below concurrency / sleep_s.
+    """
+
+    def __init__(self, concurrency: int, sleep_s: float, timeout_s: float = 15.0):
+        self._loop = asyncio.new_event_loop()
+        self._sleep_s = sleep_s
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=concurrency),
+            timeout=timeout_s,
+            follow_redirects=True,
+        )
+
+    async def _get(self, url: str) -> str:
+        async with self._semaphore:
+            response = await self._client.get(url)
+            await asyncio.sleep(self._sleep_s)
+        response.raise_for_status()
+        return response.text
+
+    def course_links(
+        self, url: str
+    ) -> Optional[Tuple[List[str], Literal["ok", "empty"]]]:
+        """Fetch and parse a results page; None means "retry with Selenium"."""
+        try:
+            html = self._loop.run_until_complete(self._get(url))
+        except httpx.HTTPError:
+            return None
+        return parse_course_links(html, url)
+
+    async def _course_page(self, url: str) -> Tuple[str, Optional[CoursePage]]:
+        try:
+            html = await self._get(url)
+        except httpx.HTTPError:
+            return url, None
+        return url, parse_course_page(html)
+
+    async def _course_pages(
+        self, urls: List[str]
+    ) -> List[Tuple[str, Optional[CoursePage]]]:
+        return await asyncio.gather(*(self._course_page(url) for url in urls))
+
+    def course_pages(self, urls: List[str]) -> List[Tuple[str, Optional[CoursePage]]]:
+        """Fetch and parse course pages concurrently; None pages need Selenium."""
+        return self._loop.run_until_complete(self._course_pages(urls))
+
+    def close(self) -> None:
+        self._loop.run_until_complete(self._client.aclose())
+        self._loop.close()
@@ -14,8 +14,10 @@ sys.path.insert(0, str(REPO_ROOT))
 
 def _deps_available() -> bool:
     try:
+        import ahocorasick  # noqa: F401
         import pandas  # noqa: F401
-        import thefuzz  # noqa: F401
+        import pyarrow  # noqa: F401
+        import rapidfuzz  # noqa: F401
     except Exception:
         return False
     return True
@@ -33,39 +35,214 @@ def _write_csv(path: Path, rows: list[dict[str, str]]) -> None:
 
 
 @unittest.skipUnless(
-    HAS_DEPS, "Requires pandas + thefuzz. Install: pip install pandas thefuzz[speedup]"
+    HAS_DEPS,
+    "Requires pandas + pyarrow + rapidfuzz + pyahocorasick. "
+    "Install: pip install pandas pyarrow rapidfuzz pyahocorasick",
 )
 class TestAiAnalysis(unittest.TestCase):
     def test_normalize_text_ai_punctuation(self) -> None:
+        import scoring
+
+        self.assertEqual(scoring.normalize_text("A.I."), "ai")
+
+    def test_fuzzy_phrase_constants_are_normalized(self) -> None:
         import ai_analysis
         import ai_analysis_broad
+        import scoring
+
+        for phrase in ai_analysis.FUZZY_PHRASES + ai_analysis_broad.BROAD_FUZZY_PHRASES:
+            self.assertEqual(scoring.normalize_text(phrase), phrase)
 
-        self.assertEqual(ai_analysis.normalize_text("A.I."), "ai")
-        self.assertEqual(ai_analysis_broad.normalize_text("A.I."), "ai")
+    def test_normalize_text_series_matches_scalar(self) -> None:
+        import pandas as pd
+
+        import scoring
+
+        raw = ["Intro to A.I.", "  Machine-Learning (ML)  ", "", "Ethics & A. I. Systems"]
+        vectorized = scoring.normalize_text_series(pd.Series(raw)).tolist()
+        self.assertEqual(vectorized, [scoring.normalize_text(t) for t in raw])
 
     def test_context_gating_ethics_requires_ai_context(self) -> None:
         import ai_analysis
+        import scoring
 
-        primary = ai_analysis.compile_patterns(ai_analysis.PRIMARY_PATTERNS)
-        secondary = ai_analysis.compile_patterns(ai_analysis.SECONDARY_PATTERNS)
-        context = ai_analysis.compile_patterns(ai_analysis.CONTEXT_PATTERNS)
+        primary = ai_analysis.PRIMARY_RE
+        secondary = ai_analysis.SECONDARY_RE
+        context = ai_analysis.CONTEXT_RE
 
         # Ethics alone should not be enough to mark a course as AI-related.
-        text_norm = ai_analysis.normalize_text("Ethics in Technology")
-        keyword_match = ai_analysis.matches_any(text_norm, primary) or (
-            ai_analysis.matches_any(text_norm, secondary)
-            and ai_analysis.matches_any(text_norm, context)
+        text_norm = scoring.normalize_text("Ethics in Technology")
+        keyword_match = bool(primary.search(text_norm)) or (
+            bool(secondary.search(text_norm)) and bool(context.search(text_norm))
         )
         self.assertFalse(keyword_match)
 
         # Ethics + explicit AI context should count.
-        text_norm = ai_analysis.normalize_text("Ethics of AI")
-        keyword_match = ai_analysis.matches_any(text_norm, primary) or (
-            ai_analysis.matches_any(text_norm, secondary)
-            and ai_analysis.matches_any(text_norm, context)
+        text_norm = scoring.normalize_text("Ethics of AI")
+        keyword_match = bool(primary.search(text_norm)) or (
+            bool(secondary.search(text_norm)) and bool(context.search(text_norm))
         )
         self.assertTrue(keyword_match)
 
+    def test_sharded_keyword_match_matches_serial(self) -> None:
+        from unittest import mock
+
+        import pandas as pd
+
+        import ai_analysis
+        import scoring
+
+        texts = pd.Series(
+            ["ethics of ai", "machine learning", "ethics", "financial accounting"] * 5,
+            dtype="string[pyarrow]",
+        )
+        expected = ai_analysis.keyword_match_mask(texts)
+        with mock.patch("scoring.os.cpu_count", return_value=3):
+            actual = scoring.map_text_shards(
+                ai_analysis.keyword_match_mask, texts, min_texts=0
+            )
+        self.assertEqual(actual.tolist(), expected.tolist())
+
+    def test_ethics_is_match_series_matches_scalar(self) -> None:
+        import pandas as pd
+
+        from ethics_analysis import EthicsMatcher
+
+        matcher = EthicsMatcher.build()
+        titles = ["Bioethics", "Accounting", None, "Intro to Philosophy"]
+        descriptions = [None, "Covers ethical issues in audits.", "Ethics", "Logic."]
+        expected = [matcher.is_match(t, d) for t, d in zip(titles, descriptions)]
+        actual = matcher.is_match_series(pd.Series(titles), pd.Series(descriptions))
+        self.assertEqual(actual.tolist(), expected)
+
+    def test_broad_labels_reports_overlapping_hits(self) -> None:
+        import ai_analysis_broad
+        import scoring
+
+        text_norm = scoring.normalize_text(
+            "Generative AI for autonomous systems"
+        )
+        self.assertEqual(
+            ai_analysis_broad.broad_labels(text_norm),
+            ["ai", "autonomous", "autonomous_systems", "generative_ai"],
+        )
+        self.assertEqual(ai_analysis_broad.broad_labels("financial accounting"), [])
+        # Plural variants and word boundaries follow the original regex patterns.
+        self.assertEqual(ai_analysis_broad.broad_labels("robotic ais"), ["robotics"])
+
+    def test_max_fuzzy_scores_tolerates_typos(self) -> None:
+        import ai_analysis
+        import scoring
+
+        texts = [
+            scoring.normalize_text("Intro to Machne Learning"),
+            scoring.normalize_text("Financial Accounting"),
+            "",
+        ]
+        scores = ai_analysis.max_fuzzy_scores(texts, ai_analysis.FUZZY_PHRASES)
+        self.assertEqual(len(scores), 3)
+        self.assertGreaterEqual(scores[0], 90)
+        self.assertLess(scores[1], 90)
+        self.assertEqual(scores[2], 0)
+
+    def test_fuzzy_prefilter_never_drops_reachable_pairs(self) -> None:
+        import ai_analysis
+        import scoring
+
+        texts = [
+            scoring.normalize_text(t)
+            for t in [
+                "Intro to Machne Learning",
+                "Artifical Inteligence",
+                "Financial Accounting",
+                "ai",
+                "Zoology of the Colorado Plateau",
+            ]
+        ]
+        phrases = ai_analysis.FUZZY_PHRASES
+        full = ai_analysis.fuzzy_score_matrix(texts, phrases)
+        for threshold in (80, 90, 95, 100):
+            filtered = ai_analysis.fuzzy_score_matrix(texts, phrases, threshold)
+            self.assertTrue(((full >= threshold) == (filtered >= threshold)).all())
+
+    def test_popcount_fallback_matches_bit_count(self) -> None:
+        import numpy as np
+
+        import scoring
+
+        values = np.array(
+            [[0, 1, 2**36 - 1], [2**64 - 1, 0x8000000000000001, 12345]],
+            dtype=np.uint64,
+        )
+        expected = [[int(v).bit_count() for v in row] for row in values.tolist()]
+        self.assertEqual(scoring.popcount_bytes(values).tolist(), expected)
+        self.assertEqual(scoring.popcount(values).tolist(), expected)
+
+    def test_ambiguous_length_mask_keeps_phrase_sized_texts(self) -> None:
+        import ai_analysis
+
+        texts = ["machne lerning", "ai", "a long description " * 10]
+        mask = ai_analysis.ambiguous_length_mask(texts, ["machine learning"])
+        self.assertEqual(mask.tolist(), [True, False, False])
+
+    def test_fuzzy_score_cache_reuses_and_extends_scores(self) -> None:
+        import scoring
+
+        phrases = ["machine learning", "deep learning"]
+        first = ["intro to machne learning", "financial accounting"]
+        second = ["deep lerning", "intro to machne learning"]
+        with TemporaryDirectory() as tmp:
+            cache_dir = Path(tmp)
+            scoring.fuzzy_score_matrix(first, phrases, 80, cache_dir=cache_dir)
+            self.assertEqual(len(list(cache_dir.glob("*.parquet"))), 1)
+            cached = scoring.fuzzy_score_matrix(second, phrases, 80, cache_dir=cache_dir)
+        expected = scoring.fuzzy_score_matrix(second, phrases, 80)
+        self.assertEqual(cached.tolist(), expected.tolist())
+
+    def test_fuzzy_score_cache_rebuilds_unreadable_file(self) -> None:
+        from unittest import mock
+
+        import scoring
+
+        phrases = ["machine learning", "deep learning"]
+        texts = ["intro to machne learning", "deep lerning"]
+        expected = scoring.fuzzy_score_matrix(texts, phrases, 80)
+        with TemporaryDirectory() as tmp:
+            cache_dir = Path(tmp)
+            scoring.fuzzy_score_matrix(texts, phrases, 80, cache_dir=cache_dir)
+            (cache_file,) = cache_dir.glob("*.parquet")
+            # Simulate a cache write that was cut off.
+            cache_file.write_bytes(cache_file.read_bytes()[:20])
+            with mock.patch("sys.stderr"):
+                rebuilt = scoring.fuzzy_score_matrix(texts, phrases, 80, cache_dir=cache_dir)
+            self.assertEqual(rebuilt.tolist(), expected.tolist())
+            self.assertEqual(list(cache_dir.iterdir()), [cache_file])
+            cached = scoring.fuzzy_score_matrix(texts, phrases, 80, cache_dir=cache_dir)
+        self.assertEqual(cached.tolist(), expected.tolist())
+
+    def test_numba_backend_matches_rapidfuzz(self) -> None:
+        try:
+            import numba  # noqa: F401
+        except ImportError:
+            self.skipTest("Requires numba. Install: pip install numba")
+        import ai_analysis
+        import scoring
+
+        texts = [
+            scoring.normalize_text(t)
+            for t in [
+                "Intro to Machne Learning",
+                "Deep learning for computer vision",
+                "Financial Accounting",
+                "ai",
+                "",
+            ]
+        ]
+        phrases = ai_analysis.FUZZY_PHRASES
+        expected = ai_analysis.fuzzy_score_matrix(texts, phrases)
+        actual = ai_analysis.fuzzy_score_matrix(texts, phrases, backend="numba")
+        self.assertEqual(actual.tolist(), expected.tolist())
+
     def test_ai_analysis_dedup_and_unique_flags(self) -> None:
         with TemporaryDirectory() as tmp:
             tmp_path = Path(tmp)
@@ -108,6 +285,8 @@ class TestAiAnalysis(unittest.TestCase):
                     str(input_csv),
                     "--output-dir",
                     str(out_dir),
+                    "--emit-full",
+                    "--csv-compat",
                 ],
                 check=True,
             )
@@ -0,0 +1,307 @@
+import csv
+import os
+import pickle
+import sys
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+# See tests/test_ai_analysis.py: make the repo-root scripts importable.
+sys.path.insert(0, str(REPO_ROOT))
+
+
+def _has(*modules: str) -> bool:
+    try:
+        for module in modules:
+            __import__(module)
+    except Exception:
+        return False
+    return True
+
+
+RESULTS_HTML = """
+<div id="main"><h1>Results</h1>
+<dl id="results-list">
+  <dt class="result-item"><a href="course?courseId=000004&amp;term=1257">ACC 199</a></dt>
+  <dt class="result-item"><a href="course?courseId=000004&amp;term=1257">ACC 199</a></dt>
+  <dt class="result-item"><a href="https://catalog.nau.edu/Courses/course?courseId=000010&amp;term=1257">ACC 255</a></dt>
+  <dt class="result-item"><a>no href</a></dt>
+</dl></div>
+"""
+
+COURSE_HTML = """
+<h1 id="h1-first">Course Catalog  Catalog Year: 2025 - 2026</h1>
+<div id="courseResults">
+  <h2>CS  470 -
+    Artificial Intelligence</h2>
+  <strong>Description:</strong>
+    Study of intelligent systems.
+  <br><strong>Units:</strong> <span> 3 </span><br>
+  <strong>Sections offered:</strong>
+  <a href="#">Fall 2025</a>, <span>ignored</span>
+  <a href="#">  Spring
+    2026 </a>
+</div>
+"""
+
+
+@unittest.skipUnless(
+    _has("httpx", "selectolax"),
+    "Requires httpx + selectolax. Install: pip install httpx selectolax",
+)
+class TestStaticFetch(unittest.TestCase):
+    PAGE_URL = "https://catalog.nau.edu/Courses/results?subject=ACC&catNbr=&term=1257"
+
+    def test_parse_course_links_resolves_and_dedupes_hrefs(self) -> None:
+        from static_fetch import parse_course_links
+
+        links, status = parse_course_links(RESULTS_HTML, self.PAGE_URL)
+        self.assertEqual(status, "ok")
+        self.assertEqual(
+            sorted(links),
+            [
+                "https://catalog.nau.edu/Courses/course?courseId=000004&term=1257",
+                "https://catalog.nau.edu/Courses/course?courseId=000010&term=1257",
+            ],
+        )
+
+    def test_parse_course_links_empty_and_unknown_pages(self) -> None:
+        from static_fetch import parse_course_links
+
+        empty = '<div id="main"><h1>  No courses\n found </h1></div>'
+        self.assertEqual(parse_course_links(empty, self.PAGE_URL), ([], "empty"))
+        # Neither links nor the "no courses" message: let Selenium retry it.
+        self.assertIsNone(parse_course_links("<p>Loading...</p>", self.PAGE_URL))
+
+    def test_parse_course_page_reads_all_fields(self) -> None:
+        from static_fetch import parse_course_page
+
+        self.assertEqual(
+            parse_course_page(COURSE_HTML),
+            {
+                "header": "CS 470 - Artificial Intelligence",
+                "catalog_header": "Course Catalog Catalog Year: 2025 - 2026",
+                "description": "Study of intelligent systems.",
+                "units": "3",
+                "sections_offered": "Fall 2025; Spring 2026",
+            },
+        )
+
+    def test_parse_course_page_missing_fields(self) -> None:
+        from static_fetch import parse_course_page
+
+        page = parse_course_page(
+            '<div id="courseResults"><h2>ART 100 - Drawing</h2>'
+            "<strong>Units:</strong> <strong>Sections offered:</strong></div>"
+        )
+        self.assertEqual(page["header"], "ART 100 - Drawing")
+        self.assertIsNone(page["catalog_header"])
+        self.assertIsNone(page["description"])
+        # Like COURSE_FIELDS_JS, the first non-empty sibling text wins, even a label.
+        self.assertEqual(page["units"], "Sections offered:")
+        self.assertIsNone(page["sections_offered"])
+        self.assertIsNone(parse_course_page("<div id='courseResults'></div>"))
+
+
+@unittest.skipUnless(_has("pyarrow"), "Requires pyarrow. Install: pip install pyarrow")
+class TestParquetStore(unittest.TestCase):
+    FIELDNAMES = ["term", "url"]
+
+    def test_writer_round_trips_urls_across_parts(self) -> None:
+        import parquet_store
+
+        with TemporaryDirectory() as tmp:
+            path = str(Path(tmp) / "courses.parquet")
+            self.assertEqual(parquet_store.load_urls(path), set())
+
+            rows = [("Fall 2025", f"u{i}") for i in range(parquet_store.PART_ROWS + 5)]
+            rows.append(("Fall 2025", None))
+            writer = parquet_store.ParquetAppendWriter(path, self.FIELDNAMES)
+            writer.writerows(rows)
+            writer.close()
+
+            parts = sorted(p.name for p in Path(path).iterdir())
+            self.assertEqual(len(parts), 2)
+            self.assertTrue(all(name.startswith("part-") for name in parts))
+            self.assertEqual(
+                parquet_store.load_urls(path),
+                {f"u{i}" for i in range(parquet_store.PART_ROWS + 5)},
+            )
+
+            parquet_store.remove(path)
+            self.assertFalse(Path(path).exists())
+
+    def test_unfinished_part_is_invisible(self) -> None:
+        import parquet_store
+
+        with TemporaryDirectory() as tmp:
+            path = str(Path(tmp) / "courses.parquet")
+            done = parquet_store.ParquetAppendWriter(path, self.FIELDNAMES)
+            done.writerows([("Fall 2025", "a")])
+            done.close()
+
+            # A run killed mid-write never closes its writer.
+            killed = parquet_store.ParquetAppendWriter(path, self.FIELDNAMES)
+            killed.writerows([("Fall 2025", "b")] * parquet_store.BATCH_ROWS)
+            self.assertEqual(parquet_store.load_urls(path), {"a"})
+
+        # A writer that never received rows leaves nothing behind.
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp) / "courses.parquet"
+            parquet_store.ParquetAppendWriter(str(path), self.FIELDNAMES).close()
+            self.assertFalse(path.exists())
+
+
+@unittest.skipUnless(
+    _has("selenium"), "Requires selenium. Install: pip install selenium"
+)
+class TestLoadExistingUrls(unittest.TestCase):
+    def _write_courses(self, path: Path, urls: list[str]) -> None:
+        with path.open("w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["term", "url"])
+            writer.writerows(("Fall 2025", url) for url in urls)
+
+    def test_sidecar_is_reused_until_csv_changes(self) -> None:
+        import scrape
+
+        with TemporaryDirectory() as tmp:
+            csv_path = Path(tmp) / "courses.csv"
+            cache_path = Path(tmp) / "courses.urls.pkl"
+            with mock.patch.multiple(
+                scrape, CSV_PATH=str(csv_path), URLS_CACHE_PATH=str(cache_path)
+            ), mock.patch("builtins.print"):
+                self.assertEqual(scrape.load_existing_urls(), set())
+                self.assertFalse(cache_path.exists())
+
+                self._write_courses(csv_path, ["a", "b", ""])
+                self.assertEqual(scrape.load_existing_urls(), {"a", "b"})
+                with cache_path.open("rb") as f:
+                    self.assertEqual(pickle.load(f), {"a", "b"})
+
+                # A sidecar at least as new as the CSV is trusted as-is.
+                with cache_path.open("wb") as f:
+                    pickle.dump({"cached"}, f)
+                csv_mtime = csv_path.stat().st_mtime_ns
+                os.utime(cache_path, ns=(csv_mtime, csv_mtime))
+                self.assertEqual(scrape.load_existing_urls(), {"cached"})
+
+                # Writing the CSV makes it newer, so it's read again.
+                self._write_courses(csv_path, ["a", "b", "c"])
+                os.utime(csv_path, ns=(csv_mtime + 10**9, csv_mtime + 10**9))
+                self.assertEqual(scrape.load_existing_urls(), {"a", "b", "c"})
+
+                # An unreadable sidecar falls back to the CSV.
+                cache_path.write_bytes(b"not a pickle")
+                os.utime(cache_path, ns=(csv_mtime + 2 * 10**9,) * 2)
+                self.assertEqual(scrape.load_existing_urls(), {"a", "b", "c"})
+
+
+@unittest.skipUnless(
+    _has("selenium"), "Requires selenium. Install: pip install selenium"
+)
+class TestPoliteSleep(unittest.TestCase):
+    def setUp(self) -> None:
+        import multiprocessing
+
+        import scrape
+
+        saved = (scrape._next_slot, scrape._min_interval)
+        self.addCleanup(scrape.configure_rate_limit, *saved)
+        self.next_slot = multiprocessing.Value("d", 0.0)
+        scrape.configure_rate_limit(self.next_slot, 0.25)
+
+    def _polite_sleep_at(self, now: float) -> list[float]:
+        """Run polite_sleep at a fake monotonic time; return the sleeps it made."""
+        import scrape
+
+        with mock.patch.object(
+            scrape.time, "monotonic", return_value=now
+        ), mock.patch.object(scrape.time, "sleep") as sleep:
+            scrape.polite_sleep()
+        return [call.args[0] for call in sleep.call_args_list]
+
+    def test_slots_are_reserved_min_interval_apart(self) -> None:
+        # First request goes out immediately; back-to-back ones queue behind it.
+        self.assertEqual(self._polite_sleep_at(100.0), [])
+        self.assertAlmostEqual(self.next_slot.value, 100.25)
+        self.assertEqual(self._polite_sleep_at(100.0), [0.25])
+        self.assertAlmostEqual(self.next_slot.value, 100.5)
+        (wait,) = self._polite_sleep_at(100.1)
+        self.assertAlmostEqual(wait, 0.4)
+        self.assertAlmostEqual(self.next_slot.value, 100.75)
+
+    def test_no_sleep_once_interval_has_elapsed(self) -> None:
+        self._polite_sleep_at(100.0)
+        # Time spent loading the page already covers the interval.
+        self.assertEqual(self._polite_sleep_at(100.3), [])
+        self.assertAlmostEqual(self.next_slot.value, 100.55)
+        self.assertEqual(self._polite_sleep_at(100.55), [])
+        self.assertAlmostEqual(self.next_slot.value, 100.8)
+
+
+class _FakeResult:
+    def __init__(self, pool: "_FakeListPool", task: tuple[int, str]):
+        self.pool = pool
+        self.task = task
+        self.value = None
+
+    def get(self):
+        # Everything submitted so far finishes, in a shuffled order.
+        self.pool.finish_all()
+        self.pool.in_flight -= 1
+        return self.value
+
+
+class _FakeListPool:
+    def __init__(self, seed: int):
+        import random
+
+        self.rng = random.Random(seed)
+        self.pending: list[_FakeResult] = []
+        self.finished: list[tuple[int, str]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def apply_async(self, func, args):
+        (task,) = args
+        result = _FakeResult(self, task)
+        self.pending.append(result)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        return result
+
+    def finish_all(self) -> None:
+        self.rng.shuffle(self.pending)
+        for result in self.pending:
+            term_code, prefix = result.task
+            result.value = ([f"{term_code}/{prefix}"], "ok")
+            self.finished.append(result.task)
+        self.pending.clear()
+
+
+@unittest.skipUnless(
+    _has("selenium"), "Requires selenium. Install: pip install selenium"
+)
+class TestCourseListings(unittest.TestCase):
+    def test_listings_follow_task_order_with_bounded_prefetch(self) -> None:
+        import scrape
+
+        tasks = [(term, f"P{i}") for term in (1257, 1261) for i in range(7)]
+        for seed in range(5):
+            pool = _FakeListPool(seed)
+            browsers = mock.Mock(list_pool=pool, list_workers=2)
+            listings = list(scrape.course_listings(browsers, None, tasks))
+
+            self.assertEqual(
+                listings, [([f"{term}/{prefix}"], "ok") for term, prefix in tasks]
+            )
+            self.assertNotEqual(pool.finished, tasks)  # Really completed out of order.
+            self.assertLessEqual(pool.max_in_flight, 2 * browsers.list_workers)
+            self.assertEqual(pool.in_flight, 0)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)